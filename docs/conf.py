@@ -1,6 +1,4 @@
 import os
-import sys
-sys.path.insert(0, os.path.abspath('../'))
 
 # Project information
 project = 'Google Earth Engine Documentation'
@@ -10,14 +8,22 @@ release = '1.0.0'
 
 # Extensions
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.viewcode',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
     'sphinx_copybutton',
     'myst_parser',
 ]
 
+# Highlighted source pages are skipped when FAST_DOCS is set (e.g. CI checks)
+if not os.environ.get('FAST_DOCS'):
+    extensions.append('sphinx.ext.viewcode')
+
+# AutoAPI configuration (parses the examples statically, nothing is imported)
+autoapi_type = 'python'
+autoapi_dirs = ['../examples']
+autoapi_keep_files = True
+
 # Templates path
 templates_path = ['_templates']
 
@@ -42,23 +48,23 @@ html_theme_options = {
 copybutton_prompt_text = "$ "
 copybutton_only_copy_prompt_lines = False
 
-# Intersphinx mapping
 # Intersphinx mapping - remove the broken Earth Engine URL
+# A local inventory under _inv/ is tried first so cold builds stay offline.
 intersphinx_mapping = {
-    'python': ('https://docs.python.org/3', None),
+    'python': ('https://docs.python.org/3', ('_inv/python.inv', None)),
     # Remove this line: 'ee': ('https://developers.google.com/earth-engine/apidocs', None),
 }
 
+# Cached remote inventories are reused for 90 days before being refetched.
+# Run "make inventories" to refresh the local copies under _inv/.
+intersphinx_cache_limit = 90
+
 
 # MyST configuration
+# Only the lightweight syntax extensions are enabled; linkify, smartquotes,
+# replacements and substitution walk every text node. Bare URLs in Markdown
+# are therefore not auto-linked - write them as <https://...> instead.
 myst_enable_extensions = [
     "colon_fence",
     "deflist",
-    "html_admonition",
-    "html_image",
-    "linkify",
-    "replacements",
-    "smartquotes",
-    "substitution",
-    "tasklist",
 ]
@@ -12,37 +12,92 @@ This example demonstrates:
 Use case: Mapping land cover types using Sentinel-2 imagery
 """
 
+import hashlib
+import json
+import os
+import time
+
 import ee
 import numpy as np
-import pandas as pd
-from sklearn.metrics import classification_report, confusion_matrix
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+def _fit_forest_shard(X, y, n_trees, seed, bag_fraction, max_depth):
+    """
+    Fit one shard of a local Random Forest (runs in a worker process).
+    """
+    from sklearn.ensemble import RandomForestClassifier
+    
+    forest = RandomForestClassifier(
+        n_estimators=n_trees,
+        max_depth=max_depth,
+        max_samples=bag_fraction,
+        random_state=seed,
+        n_jobs=1
+    )
+    return forest.fit(X, y)
 
 class LandCoverClassifier:
     """
     Advanced land cover classification using Google Earth Engine and Machine Learning.
     """
     
-    def __init__(self, project_id):
+    # Feature bands used for sampling, training and classification
+    _BANDS = ('B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12',
+              'NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI')
+    
+    def __init__(self, project_id, bucket=None, verbose=False):
         """
         Initialize the classifier with Earth Engine project.
+        
+        Args:
+            project_id: Google Cloud project ID
+            bucket: Cloud Storage bucket that receives exports
+            verbose: Print collection/sample counts (each costs a server round-trip)
         """
         self.project_id = project_id
+        self.bucket = bucket
+        self.verbose = verbose
         self.classifier = None
         self.trained_classifier = None
+        self.local_classifier = None
+        self._composite = None
+        self._X = None
+        self._y = None
+        self._labeled_points = []
         self.class_names = ['Water', 'Forest', 'Urban', 'Agriculture', 'Bare_Soil']
         self.class_values = [0, 1, 2, 3, 4]
         
-        # Initialize Earth Engine
+        # Earth Engine is initialized on first use, not at construction time
+        self._initialized = False
+    
+    def _ensure_ee(self):
+        """
+        Initialize Earth Engine the first time it is needed.
+        """
+        if self._initialized:
+            return
+        
         try:
-            ee.Initialize(project=project_id)
+            ee.Initialize(project=self.project_id)
             print("✓ Earth Engine initialized successfully!")
         except Exception as e:
             print(f"✗ Error initializing Earth Engine: {e}")
             raise
+        
+        self._initialized = True
     
-    def create_composite(self, geometry, start_date, end_date, cloud_threshold=10):
+    def initialize(self):
+        """
+        Initialize Earth Engine before building EE objects outside this class.
+        
+        Returns:
+            LandCoverClassifier: self, for chaining
+        """
+        self._ensure_ee()
+        
+        return self
+    
+    def create_composite(self, geometry, start_date, end_date, cloud_threshold=10,
+                         clear_threshold=0.6):
         """
         Create a cloud-free Sentinel-2 composite.
         
@@ -51,34 +106,41 @@ class LandCoverClassifier:
             start_date: Start date for image collection
             end_date: End date for image collection
             cloud_threshold: Maximum cloud cover percentage
+            clear_threshold: Minimum Cloud Score+ 'cs' value for a clear pixel
         
         Returns:
             ee.Image: Cloud-free composite image
         """
+        self._ensure_ee()
+        
         print(f"Creating Sentinel-2 composite from {start_date} to {end_date}")
         
-        # Load Sentinel-2 Surface Reflectance collection
-        collection = (ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-                     .filterDate(start_date, end_date)
-                     .filterBounds(geometry)
-                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', cloud_threshold)))
+        # Load Sentinel-2 Surface Reflectance collection with one combined filter
+        collection = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED').filter(
+            ee.Filter.And(
+                ee.Filter.date(start_date, end_date),
+                ee.Filter.bounds(geometry),
+                ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', cloud_threshold)
+            )
+        )
         
-        print(f"Found {collection.size().getInfo()} images")
+        # Attach the Cloud Score+ 'cs' band instead of decoding QA60 bits
+        cs_plus = ee.ImageCollection('GOOGLE/CLOUD_SCORE_PLUS/V1/S2_HARMONIZED')
+        collection = collection.linkCollection(cs_plus, ['cs'])
         
-        # Cloud masking function
-        def mask_clouds(image):
-            qa = image.select('QA60')
-            cloud_bit_mask = 1 << 10
-            cirrus_bit_mask = 1 << 11
-            mask = qa.bitwiseAnd(cloud_bit_mask).eq(0).And(
-                   qa.bitwiseAnd(cirrus_bit_mask).eq(0))
-            return image.updateMask(mask).divide(10000)
+        if self.verbose:
+            print(f"Found {collection.size().getInfo()} images")
         
         # Apply cloud masking and create median composite
-        composite = collection.map(mask_clouds).median()
+        composite = collection.map(
+            lambda image: image.updateMask(image.select('cs').gte(clear_threshold))
+                               .select('B.*')
+                               .divide(10000)
+        ).median()
         
-        # Add spectral indices
-        composite = self.add_spectral_indices(composite)
+        # Add spectral indices and keep only the feature bands
+        composite = self.add_spectral_indices(composite).select(list(self._BANDS))
+        self._composite = composite
         
         return composite
     
@@ -92,86 +154,131 @@ class LandCoverClassifier:
         Returns:
             ee.Image: Image with additional spectral indices
         """
-        # NDVI (Normalized Difference Vegetation Index)
-        ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
-        
-        # NDWI (Normalized Difference Water Index)
-        ndwi = image.normalizedDifference(['B3', 'B8']).rename('NDWI')
+        # Source bands are selected once and shared by every index below
+        inputs = {
+            'BLUE': image.select('B2'),
+            'GREEN': image.select('B3'),
+            'RED': image.select('B4'),
+            'NIR': image.select('B8'),
+            'SWIR1': image.select('B11')
+        }
         
-        # NDBI (Normalized Difference Built-up Index)
-        ndbi = image.normalizedDifference(['B11', 'B8']).rename('NDBI')
+        # NDVI, NDWI and NDBI as one band-wise (a - b) / (a + b) over stacked pairs
+        first = ee.Image.cat([inputs['NIR'], inputs['GREEN'], inputs['SWIR1']])
+        second = ee.Image.cat([inputs['RED'], inputs['NIR'], inputs['NIR']])
+        normalized = (first.subtract(second)
+                      .divide(first.add(second))
+                      .rename(['NDVI', 'NDWI', 'NDBI']))
         
         # EVI (Enhanced Vegetation Index)
         evi = image.expression(
-            '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))',
-            {
-                'NIR': image.select('B8'),
-                'RED': image.select('B4'),
-                'BLUE': image.select('B2')
-            }
+            '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))', inputs
         ).rename('EVI')
         
         # SAVI (Soil Adjusted Vegetation Index)
         savi = image.expression(
-            '((NIR - RED) / (NIR + RED + 0.5)) * (1.5)',
-            {
-                'NIR': image.select('B8'),
-                'RED': image.select('B4')
-            }
+            '((NIR - RED) / (NIR + RED + 0.5)) * (1.5)', inputs
         ).rename('SAVI')
         
-        return image.addBands([ndvi, ndwi, ndbi, evi, savi])
+        return image.addBands([normalized, evi, savi])
     
-    def create_training_data(self, image, training_points):
+    def create_training_data(self, image=None, training_points=None,
+                             sample_fraction=1.0, max_per_class=None):
         """
         Create training dataset from labeled points.
         
         Args:
-            image: Composite image for training
+            image: Composite image for training (defaults to the last composite)
             training_points: ee.FeatureCollection with training points
+            sample_fraction: Fraction of sampled pixels to keep
+            max_per_class: Cap on samples per class to keep classes balanced
         
         Returns:
             ee.FeatureCollection: Training features with spectral values
         """
+        self._ensure_ee()
+        
         print("Creating training dataset...")
         
-        # Select bands for training
-        bands = ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12',
-                'NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI']
+        if image is None:
+            image = self._composite
         
         # Sample the image at training points
-        training = image.select(bands).sampleRegions(
+        training = image.sampleRegions(
             collection=training_points,
             properties=['landcover'],
             scale=10
         )
         
-        print(f"Training samples: {training.size().getInfo()}")
+        # Subsample server-side; seed 1 keeps this independent of the
+        # train/validation split drawn later with seed 0
+        if sample_fraction < 1.0 or max_per_class is not None:
+            training = training.randomColumn('sample_rnd', 1)
+        
+        if sample_fraction < 1.0:
+            training = training.filter(ee.Filter.lt('sample_rnd', sample_fraction))
+        
+        if max_per_class is not None:
+            training = ee.FeatureCollection([
+                training.filter(ee.Filter.eq('landcover', value))
+                        .limit(max_per_class, 'sample_rnd')
+                for value in self.class_values
+            ]).flatten()
+        
+        if self.verbose:
+            print(f"Training samples: {training.size().getInfo()}")
         
         return training
     
-    def train_classifier(self, training_data, n_trees=100):
+    def split_training_data(self, training_data, train_fraction=0.7, seed=0):
+        """
+        Split samples into training and held-out validation sets.
+        
+        Args:
+            training_data: Sampled feature collection
+            train_fraction: Fraction of samples used for training
+            seed: Random seed for the split
+        
+        Returns:
+            tuple: (training, validation) feature collections
+        """
+        self._ensure_ee()
+        
+        samples = training_data.randomColumn('rnd', seed)
+        training = samples.filter(ee.Filter.lt('rnd', train_fraction))
+        validation = samples.filter(ee.Filter.gte('rnd', train_fraction))
+        
+        return training, validation
+    
+    def train_classifier(self, training_data, n_trees=100, variables_per_split=4,
+                         bag_fraction=0.63):
         """
         Train Random Forest classifier.
         
         Args:
             training_data: Training feature collection
             n_trees: Number of trees in Random Forest
+            variables_per_split: Features tried per split (~sqrt of the band count)
+            bag_fraction: Fraction of samples bagged per tree
         
         Returns:
             ee.Classifier: Trained classifier
         """
-        print(f"Training Random Forest classifier with {n_trees} trees...")
+        self._ensure_ee()
         
-        # Select features for training
-        bands = ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12',
-                'NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI']
+        print(f"Training Random Forest classifier with {n_trees} trees...")
         
         # Create and train classifier
-        classifier = ee.Classifier.smileRandomForest(n_trees).train(
+        classifier = ee.Classifier.smileRandomForest(
+            numberOfTrees=n_trees,
+            variablesPerSplit=variables_per_split,
+            minLeafPopulation=1,
+            bagFraction=bag_fraction,
+            seed=0
+        ).train(
             features=training_data,
             classProperty='landcover',
-            inputProperties=bands
+            inputProperties=list(self._BANDS)
         )
         
         self.trained_classifier = classifier
@@ -179,17 +286,180 @@ class LandCoverClassifier:
         
         return classifier
     
-    def classify_image(self, image, classifier=None):
+    def _to_numpy(self, training_data):
+        """
+        Download training samples once as contiguous float32 arrays.
+        
+        Args:
+            training_data: Sampled feature collection
+        
+        Returns:
+            tuple: (X, y) with X shaped (n_samples, n_features)
+        """
+        self._ensure_ee()
+        
+        columns = list(self._BANDS) + ['landcover']
+        rows = training_data.reduceColumns(
+            ee.Reducer.toList(len(columns)), columns
+        ).get('list').getInfo()
+        
+        samples = np.asarray(rows, dtype=np.float32)
+        self._X = np.ascontiguousarray(samples[:, :-1])
+        self._y = samples[:, -1].astype(np.int32)
+        
+        return self._X, self._y
+    
+    def train_local_classifier(self, X=None, y=None, n_trees=100, n_jobs=-1,
+                               bag_fraction=0.63, max_depth=20, training_data=None):
+        """
+        Train a scikit-learn Random Forest locally, building trees in parallel.
+        
+        The forest is split into shards with distinct seeds, each shard is fit
+        in its own process, and the shards' trees are merged into one forest.
+        
+        Args:
+            X: Feature array of shape (n_samples, n_features)
+            y: Class labels of shape (n_samples,)
+            n_trees: Total number of trees in the forest
+            n_jobs: Number of worker processes (-1 uses all cores)
+            bag_fraction: Fraction of samples drawn for each tree
+            max_depth: Maximum tree depth (shallower trees predict faster)
+            training_data: Feature collection to download when X/y are not given
+        
+        Returns:
+            sklearn.ensemble.RandomForestClassifier: Trained forest
+        """
+        from joblib import Parallel, cpu_count, delayed
+        
+        if X is None or y is None:
+            if self._X is None:
+                if training_data is None:
+                    raise ValueError("No training samples available")
+                self._to_numpy(training_data)
+            X, y = self._X, self._y
+        
+        n_workers = cpu_count() if n_jobs == -1 else n_jobs
+        n_shards = max(1, min(n_trees, n_workers))
+        shard_sizes = [n_trees // n_shards + (1 if i < n_trees % n_shards else 0)
+                       for i in range(n_shards)]
+        
+        print(f"Training local Random Forest with {n_trees} trees "
+              f"across {n_shards} workers...")
+        
+        shards = Parallel(n_jobs=n_shards)(
+            delayed(_fit_forest_shard)(X, y, size, seed, bag_fraction, max_depth)
+            for seed, size in enumerate(shard_sizes)
+        )
+        
+        # Merge the shards' trees into the first forest
+        forest = shards[0]
+        for shard in shards[1:]:
+            forest.estimators_.extend(shard.estimators_)
+        forest.n_estimators = len(forest.estimators_)
+        
+        # Small prediction batches are faster without joblib overhead
+        forest.set_params(n_jobs=1)
+        
+        self.local_classifier = forest
+        print("✓ Local classifier training completed!")
+        
+        return forest
+    
+    def inputs_digest(self, start_date, end_date, n_trees):
+        """
+        Hash the training inputs so cached results can be matched to them.
+        
+        Args:
+            start_date: Composite start date
+            end_date: Composite end date
+            n_trees: Number of trees in Random Forest
+        
+        Returns:
+            str: Short hex digest of the inputs
+        """
+        key = json.dumps([self._labeled_points, start_date, end_date, n_trees])
+        
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    
+    def classifier_asset_id(self, start_date, end_date, n_trees):
+        """
+        Build an asset ID that changes whenever the training inputs change.
+        
+        Args:
+            start_date: Composite start date
+            end_date: Composite end date
+            n_trees: Number of trees in Random Forest
+        
+        Returns:
+            str: Asset ID for the cached classifier
+        """
+        digest = self.inputs_digest(start_date, end_date, n_trees)
+        
+        return f'projects/{self.project_id}/assets/rf_landcover_{digest}'
+    
+    def save_classifier(self, classifier, asset_id):
+        """
+        Persist a trained classifier as an Earth Engine asset.
+        
+        Args:
+            classifier: Trained classifier
+            asset_id: Destination asset ID
+        
+        Returns:
+            ee.batch.Task: Export task
+        """
+        self._ensure_ee()
+        
+        task = ee.batch.Export.classifier.toAsset(
+            classifier=classifier,
+            description='rf_landcover',
+            assetId=asset_id
+        )
+        
+        task.start()
+        print(f"Saving classifier to asset: {asset_id}")
+        
+        return task
+    
+    def load_classifier(self, asset_id):
+        """
+        Load a previously saved classifier asset.
+        
+        Args:
+            asset_id: Classifier asset ID
+        
+        Returns:
+            ee.Classifier: Cached classifier, or None if the asset does not exist
+        """
+        self._ensure_ee()
+        
+        try:
+            ee.data.getAsset(asset_id)
+        except ee.EEException:
+            return None
+        
+        print(f"✓ Loaded cached classifier: {asset_id}")
+        self.trained_classifier = ee.Classifier.load(asset_id)
+        
+        return self.trained_classifier
+    
+    def classify_image(self, image=None, classifier=None, asset_id=None):
         """
         Classify the input image using trained classifier.
         
         Args:
-            image: Image to classify
+            image: Image to classify (defaults to the last composite)
             classifier: Trained classifier (optional)
+            asset_id: Saved classifier asset to use instead (optional)
         
         Returns:
             ee.Image: Classified image
         """
+        self._ensure_ee()
+        
+        if classifier is None and asset_id is not None:
+            classifier = self.load_classifier(asset_id)
+        
         if classifier is None:
             classifier = self.trained_classifier
         
@@ -198,48 +468,64 @@ class LandCoverClassifier:
         
         print("Classifying image...")
         
-        # Select the same bands used for training
-        bands = ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12',
-                'NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI']
+        if image is None:
+            image = self._composite
         
-        classified = image.select(bands).classify(classifier)
+        # The composite already holds only the training bands
+        classified = image.classify(classifier)
         
         return classified
     
-    def assess_accuracy(self, training_data, classifier=None):
+    def assess_accuracy(self, validation_data, classifier=None, cache_file=None):
         """
-        Assess classifier accuracy using confusion matrix.
+        Assess classifier accuracy on held-out samples using an error matrix.
         
         Args:
-            training_data: Validation dataset
+            validation_data: Validation dataset not used for training
             classifier: Trained classifier
+            cache_file: JSON file to reuse metrics from on re-runs (optional)
         
         Returns:
             dict: Accuracy metrics
         """
+        if cache_file is not None and os.path.exists(cache_file):
+            with open(cache_file) as f:
+                print(f"✓ Loaded cached accuracy metrics: {cache_file}")
+                return json.load(f)
+        
+        self._ensure_ee()
+        
         if classifier is None:
             classifier = self.trained_classifier
         
         print("Assessing accuracy...")
         
-        # Get confusion matrix
-        confusion_matrix = classifier.confusionMatrix()
-        
-        # Calculate accuracy metrics
-        overall_accuracy = confusion_matrix.accuracy()
-        kappa = confusion_matrix.kappa()
+        # Classify the held-out samples and compare against their labels
+        validated = validation_data.classify(classifier)
+        error_matrix = validated.errorMatrix('landcover', 'classification')
         
-        print(f"Overall Accuracy: {overall_accuracy.getInfo():.3f}")
-        print(f"Kappa Coefficient: {kappa.getInfo():.3f}")
+        # Fetch all accuracy metrics in a single round-trip
+        metrics = ee.Dictionary({
+            'oa': error_matrix.accuracy(),
+            'kappa': error_matrix.kappa(),
+            'cm': error_matrix.array()
+        }).getInfo()
         
-        # Get confusion matrix as array
-        cm_array = confusion_matrix.getInfo()
+        print(f"Overall Accuracy: {metrics['oa']:.3f}")
+        print(f"Kappa Coefficient: {metrics['kappa']:.3f}")
         
-        return {
-            'overall_accuracy': overall_accuracy.getInfo(),
-            'kappa': kappa.getInfo(),
-            'confusion_matrix': cm_array
+        results = {
+            'overall_accuracy': metrics['oa'],
+            'kappa': metrics['kappa'],
+            'confusion_matrix': metrics['cm']
         }
+        
+        if cache_file is not None:
+            os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(results, f)
+        
+        return results
     
     def create_training_points(self, geometry):
         """
@@ -253,45 +539,33 @@ class LandCoverClassifier:
         Returns:
             ee.FeatureCollection: Training points
         """
+        self._ensure_ee()
+        
         print("Creating sample training points...")
         
         # Example training points (replace with actual training data)
-        water_points = ee.FeatureCollection([
-            ee.Feature(ee.Geometry.Point([-122.0, 37.4]), {'landcover': 0}),
-            ee.Feature(ee.Geometry.Point([-122.1, 37.3]), {'landcover': 0}),
-        ])
-        
-        forest_points = ee.FeatureCollection([
-            ee.Feature(ee.Geometry.Point([-122.2, 37.5]), {'landcover': 1}),
-            ee.Feature(ee.Geometry.Point([-122.3, 37.6]), {'landcover': 1}),
-        ])
-        
-        urban_points = ee.FeatureCollection([
-            ee.Feature(ee.Geometry.Point([-122.4, 37.7]), {'landcover': 2}),
-            ee.Feature(ee.Geometry.Point([-122.5, 37.8]), {'landcover': 2}),
-        ])
-        
-        agriculture_points = ee.FeatureCollection([
-            ee.Feature(ee.Geometry.Point([-122.6, 37.2]), {'landcover': 3}),
-            ee.Feature(ee.Geometry.Point([-122.7, 37.1]), {'landcover': 3}),
-        ])
-        
-        bare_soil_points = ee.FeatureCollection([
-            ee.Feature(ee.Geometry.Point([-122.8, 37.0]), {'landcover': 4}),
-            ee.Feature(ee.Geometry.Point([-122.9, 36.9]), {'landcover': 4}),
+        # Each entry is ([lon, lat], landcover class value)
+        labeled_points = [
+            ([-122.0, 37.4], 0), ([-122.1, 37.3], 0),  # Water
+            ([-122.2, 37.5], 1), ([-122.3, 37.6], 1),  # Forest
+            ([-122.4, 37.7], 2), ([-122.5, 37.8], 2),  # Urban
+            ([-122.6, 37.2], 3), ([-122.7, 37.1], 3),  # Agriculture
+            ([-122.8, 37.0], 4), ([-122.9, 36.9], 4),  # Bare soil
+        ]
+        
+        self._labeled_points = labeled_points
+        
+        # Build a single flat collection instead of merging one per class
+        training_points = ee.FeatureCollection([
+            ee.Feature(ee.Geometry.Point(coords), {'landcover': value})
+            for coords, value in labeled_points
         ])
         
-        # Merge all training points
-        training_points = water_points.merge(forest_points)\
-                                   .merge(urban_points)\
-                                   .merge(agriculture_points)\
-                                   .merge(bare_soil_points)
-        
         return training_points
     
     def export_classification(self, classified_image, geometry, filename, scale=10):
         """
-        Export classified image to Google Drive.
+        Export classified image to Cloud Storage as a Cloud Optimized GeoTIFF.
         
         Args:
             classified_image: Classified image
@@ -299,39 +573,84 @@ class LandCoverClassifier:
             filename: Output filename
             scale: Export scale in meters
         """
-        print(f"Exporting classification to Google Drive: {filename}")
+        self._ensure_ee()
+        
+        if self.bucket is None:
+            raise ValueError("No Cloud Storage bucket configured for export")
         
-        task = ee.batch.Export.image.toDrive(
+        print(f"Exporting classification to gs://{self.bucket}/{filename}")
+        
+        task = ee.batch.Export.image.toCloudStorage(
             image=classified_image,
             description=filename,
-            folder='EarthEngine_Exports',
+            bucket=self.bucket,
             fileNamePrefix=filename,
             region=geometry,
             scale=scale,
-            maxPixels=1e13
+            maxPixels=1e13,
+            fileFormat='GeoTIFF',
+            formatOptions={'cloudOptimized': True, 'noData': 255}
         )
         
         task.start()
-        print(f"Export task started. Check Google Drive folder 'EarthEngine_Exports'")
+        print(f"Export task started. Check bucket 'gs://{self.bucket}'")
         print(f"Task ID: {task.id}")
         
         return task
+    
+    def wait_for_task(self, task_id, initial_interval=5, max_interval=60, timeout=3600):
+        """
+        Poll an export task with exponential backoff until it finishes.
+        
+        Args:
+            task_id: Earth Engine task ID
+            initial_interval: First polling interval in seconds
+            max_interval: Upper bound for the polling interval in seconds
+            timeout: Give up after this many seconds
+        
+        Returns:
+            dict: Final task status
+        """
+        self._ensure_ee()
+        
+        interval = initial_interval
+        start_time = time.time()
+        
+        while True:
+            status = ee.data.getTaskStatus([task_id])[0]
+            state = status['state']
+            
+            if state in ('COMPLETED', 'FAILED', 'CANCELLED'):
+                print(f"Task {task_id}: {state}")
+                return status
+            
+            if time.time() - start_time > timeout:
+                print(f"Task {task_id}: still {state} after {timeout}s, giving up")
+                return status
+            
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
 
 def main():
     """
     Main function demonstrating advanced machine learning classification.
     """
     # Initialize classifier
-    classifier_system = LandCoverClassifier('your-project-id')
+    classifier_system = LandCoverClassifier('your-project-id', bucket='your-bucket')
+    classifier_system.initialize()
     
     # Define area of interest (San Francisco Bay Area example)
     geometry = ee.Geometry.Rectangle([-122.5, 37.0, -121.5, 38.0])
     
+    start_date = '2023-06-01'
+    end_date = '2023-08-31'
+    n_trees = 100
+    
     # Create composite image
     composite = classifier_system.create_composite(
         geometry=geometry,
-        start_date='2023-06-01',
-        end_date='2023-08-31',
+        start_date=start_date,
+        end_date=end_date,
         cloud_threshold=10
     )
     
@@ -344,12 +663,23 @@ def main():
         training_points=training_points
     )
     
-    # Train classifier
-    classifier = classifier_system.train_classifier(
+    # Hold out part of the samples for validation
+    training_set, validation_set = classifier_system.split_training_data(
         training_data=training_data,
-        n_trees=100
+        train_fraction=0.7
     )
     
+    # Reuse a cached classifier for the same inputs, otherwise train and save it
+    asset_id = classifier_system.classifier_asset_id(start_date, end_date, n_trees)
+    classifier = classifier_system.load_classifier(asset_id)
+    
+    if classifier is None:
+        classifier = classifier_system.train_classifier(
+            training_data=training_set,
+            n_trees=n_trees
+        )
+        classifier_system.save_classifier(classifier, asset_id)
+    
     # Classify the image
     classified = classifier_system.classify_image(
         image=composite,
@@ -357,9 +687,11 @@ def main():
     )
     
     # Assess accuracy
+    digest = classifier_system.inputs_digest(start_date, end_date, n_trees)
     accuracy_metrics = classifier_system.assess_accuracy(
-        training_data=training_data,
-        classifier=classifier
+        validation_data=validation_set,
+        classifier=classifier,
+        cache_file=os.path.join('.landcover_cache', f'accuracy_{digest}.json')
     )
     
     print("\n📊 Classification Results:")
@@ -20,39 +20,180 @@ Prerequisites:
 import ee
 import time
 import json
+import atexit
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import pandas as pd
+from functools import partial
+import numpy as np
+
+HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+def _is_quota_error(error):
+    """Return True if an Earth Engine error signals rate limiting or quota."""
+    message = str(error).lower()
+    return '429' in message or 'quota' in message or 'too many' in message
+
+def _build_export_config(tile_feature, classified, output_folder):
+    """Build the export configuration for one grid tile."""
+    tile_geom = ee.Geometry(tile_feature['geometry'])
+    tile_id = tile_feature['properties']['tile_id']
+    
+    return {
+        'type': 'image',
+        'params': {
+            'image': classified,
+            'description': f'classification_tile_{tile_id}',
+            'folder': output_folder,
+            'region': tile_geom,
+            'scale': 30,
+            'crs': 'EPSG:4326',
+            'maxPixels': 1e13
+        }
+    }
+
+class RateLimiter:
+    """Thread-safe limiter allowing at most ``max_per_second`` calls per second."""
+    
+    def __init__(self, max_per_second):
+        self.max_per_second = max_per_second
+        self.calls = deque()
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block only as long as needed to stay within the rate."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                
+                # Forget calls that left the one-second window
+                while self.calls and now - self.calls[0] >= 1.0:
+                    self.calls.popleft()
+                
+                if len(self.calls) < self.max_per_second:
+                    self.calls.append(now)
+                    return
+                
+                delay = 1.0 - (now - self.calls[0])
+            
+            time.sleep(delay)
 
 class BatchProcessor:
     """Advanced batch processing system for Earth Engine operations."""
     
-    def __init__(self, project_id, max_workers=5):
+    # Task states that will not change again; UNKNOWN means the ID is not
+    # (or no longer) known to the server, e.g. from a stale state file
+    _FINISHED_STATES = ('COMPLETED', 'FAILED', 'CANCELLED', 'UNKNOWN')
+    
+    def __init__(self, project_id, max_workers=5, high_volume=True,
+                 min_poll_interval=60, max_poll_interval=600,
+                 max_task_starts_per_second=5, max_concurrent_exports=5,
+                 max_requests_per_second=20, max_retries=5,
+                 state_path=None):
         """Initialize batch processor."""
         self.project_id = project_id
         self.max_workers = max_workers
-        self.tasks = []
+        self.high_volume = high_volume
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.export_rate_limiter = RateLimiter(max_task_starts_per_second)
+        self.max_concurrent_exports = max_concurrent_exports
+        self.request_rate_limiter = RateLimiter(max_requests_per_second)
+        self.max_retries = max_retries
+        self.state_path = state_path
+        self.tasks = {}
         self.results = {}
-        
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('batch_processing.log'),
-                logging.StreamHandler()
-            ]
+        self._classifier_cache = {}
+        
+        # Setup logging: callers (including worker threads) only enqueue
+        # records, and a background listener does the file/console I/O
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('batch_processing.log')
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        self.log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler
         )
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+        
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        
+        # Resume tasks tracked by a previous run (only if state_path is given)
+        self.tasks = self.load_state()
         
         # Initialize Earth Engine
         self.initialize_ee()
     
+    def load_state(self):
+        """
+        Load task monitoring state saved by a previous run.
+        
+        Returns:
+            dict: Task IDs and their last known status (empty if no state file)
+        """
+        if self.state_path is None or not os.path.exists(self.state_path):
+            return {}
+        
+        with open(self.state_path) as f:
+            saved = json.load(f)
+        
+        tasks = {}
+        for task_id, info in saved.items():
+            tasks[task_id] = {
+                'status': info['status'],
+                'started_at': datetime.fromisoformat(info['started_at']),
+                'completed_at': (datetime.fromisoformat(info['completed_at'])
+                                 if info.get('completed_at') else None)
+            }
+        
+        self.logger.info(f"Loaded state for {len(tasks)} tasks from {self.state_path}")
+        return tasks
+    
+    def save_state(self, tasks):
+        """
+        Atomically write task monitoring state to ``state_path``.
+        
+        Args:
+            tasks: Dictionary of task IDs and configurations
+        """
+        if self.state_path is None:
+            return
+        
+        state = {
+            task_id: {
+                'status': info['status'],
+                'started_at': info['started_at'].isoformat(),
+                'completed_at': (info['completed_at'].isoformat()
+                                 if info.get('completed_at') else None)
+            }
+            for task_id, info in tasks.items()
+        }
+        
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+    
     def initialize_ee(self):
         """Initialize Earth Engine with error handling."""
         try:
-            ee.Initialize(project=self.project_id)
+            if self.high_volume:
+                # The high-volume endpoint is meant for many concurrent requests
+                ee.Initialize(project=self.project_id, opt_url=HIGH_VOLUME_URL)
+            else:
+                ee.Initialize(project=self.project_id)
             self.logger.info("✓ Earth Engine initialized successfully")
         except Exception as e:
             self.logger.error(f"✗ Failed to initialize Earth Engine: {e}")
@@ -67,64 +208,89 @@ class BatchProcessor:
             grid_size: Size of each grid cell in degrees
         
         Returns:
-            ee.FeatureCollection: Grid cells for processing
+            tuple: (ee.FeatureCollection of grid cells, number of cells)
         """
         self.logger.info(f"Creating processing grid with {grid_size}° cells")
         
-        # Get region bounds
-        bounds = region.bounds()
-        coords = ee.List(bounds.coordinates().get(0))
-        
-        # Extract coordinates
-        xs = coords.map(lambda item: ee.List(item).get(0))
-        ys = coords.map(lambda item: ee.List(item).get(1))
-        
-        min_x = xs.reduce(ee.Reducer.min())
-        max_x = xs.reduce(ee.Reducer.max())
-        min_y = ys.reduce(ee.Reducer.min())
-        max_y = ys.reduce(ee.Reducer.max())
-        
-        # Create grid
-        def create_grid_cell(x):
-            def create_cell_row(y):
-                x_coord = ee.Number(x)
-                y_coord = ee.Number(y)
-                
-                cell = ee.Geometry.Rectangle([
-                    x_coord, y_coord,
-                    x_coord.add(grid_size), y_coord.add(grid_size)
-                ])
-                
-                # Only include cells that intersect the region
-                intersects = cell.intersects(region)
-                
-                return ee.Feature(cell, {
-                    'tile_x': x_coord,
-                    'tile_y': y_coord,
-                    'tile_id': x_coord.format('%.2f').cat('_').cat(y_coord.format('%.2f')),
-                    'intersects_region': intersects
-                }).set('intersects_region', intersects)
-            
-            x_range = ee.List.sequence(min_y, max_y, grid_size)
-            return x_range.map(create_cell_row)
+        # Fetch the region bounds once and build the grid on the client
+        ring = region.bounds().getInfo()['coordinates'][0]
+        lons = [point[0] for point in ring]
+        lats = [point[1] for point in ring]
+        min_x, max_x = min(lons), max(lons)
+        min_y, max_y = min(lats), max(lats)
+        
+        xs = np.arange(min_x, max_x, grid_size)
+        ys = np.arange(min_y, max_y, grid_size)
+        
+        # Every cell starts inside the bounding box, so all of them overlap it
+        # and no per-cell server-side intersects() test is needed
+        grid_features = [
+            ee.Feature(
+                ee.Geometry.Rectangle([x, y, x + grid_size, y + grid_size]),
+                {'tile_x': float(x), 'tile_y': float(y), 'tile_id': f'{x:.2f}_{y:.2f}'}
+            )
+            for x in xs for y in ys
+        ]
         
-        x_range = ee.List.sequence(min_x, max_x, grid_size)
-        grid_features = x_range.map(create_grid_cell).flatten()
+        valid_grid = ee.FeatureCollection(grid_features)
+        tile_count = len(grid_features)
         
-        # Filter to only cells that intersect the region
-        valid_grid = ee.FeatureCollection(grid_features).filter(
-            ee.Filter.eq('intersects_region', True)
-        )
+        self.logger.info(f"Created grid with {tile_count} tiles")
         
-        grid_size_info = valid_grid.size().getInfo()
-        self.logger.info(f"Created grid with {grid_size_info} tiles")
+        return valid_grid, tile_count
+    
+    def _process_batch(self, collection, process_func, offset, batch_size,
+                       batch_num, num_batches, total_images):
+        """Process a single batch and evaluate its result (runs in a worker thread)."""
+        self.logger.info(f"Processing batch {batch_num}/{num_batches}")
         
-        return valid_grid
+        try:
+            # Get batch
+            batch = ee.ImageCollection(collection.toList(batch_size, offset))
+            
+            # Apply processing function and fetch the result, backing off
+            # only when Earth Engine reports quota pressure
+            start_time = time.time()
+            for attempt in range(self.max_retries + 1):
+                self.request_rate_limiter.wait()
+                try:
+                    batch_result = process_func(batch)
+                    if isinstance(batch_result, ee.ComputedObject):
+                        batch_result = batch_result.getInfo()
+                    break
+                except ee.EEException as e:
+                    if attempt == self.max_retries or not _is_quota_error(e):
+                        raise
+                    delay = min(60, 2 ** attempt)
+                    self.logger.warning(f"Batch {batch_num} rate limited, retrying in {delay}s")
+                    time.sleep(delay)
+            processing_time = time.time() - start_time
+            
+            self.logger.info(f"Batch {batch_num} completed in {processing_time:.2f}s")
+            
+            return {
+                'batch_id': batch_num,
+                'result': batch_result,
+                'processing_time': processing_time,
+                'images_processed': min(batch_size, total_images - offset)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error processing batch {batch_num}: {e}")
+            return {
+                'batch_id': batch_num,
+                'result': None,
+                'error': str(e),
+                'processing_time': 0
+            }
     
     def batch_image_collection_processing(self, collection, process_func, batch_size=50):
         """
         Process large image collections in batches.
         
+        Batches are evaluated concurrently by ``max_workers`` threads; each
+        worker only waits on its own Earth Engine request.
+        
         Args:
             collection: ee.ImageCollection to process
             process_func: Function to apply to each batch
@@ -136,140 +302,226 @@ class BatchProcessor:
         total_images = collection.size().getInfo()
         self.logger.info(f"Processing {total_images} images in batches of {batch_size}")
         
-        results = []
         num_batches = (total_images + batch_size - 1) // batch_size
+        offsets = range(0, total_images, batch_size)
         
-        for i in range(0, total_images, batch_size):
-            batch_num = i // batch_size + 1
-            self.logger.info(f"Processing batch {batch_num}/{num_batches}")
-            
-            try:
-                # Get batch
-                batch = collection.limit(batch_size, i)
-                
-                # Apply processing function
-                start_time = time.time()
-                batch_result = process_func(batch)
-                processing_time = time.time() - start_time
-                
-                results.append({
-                    'batch_id': batch_num,
-                    'result': batch_result,
-                    'processing_time': processing_time,
-                    'images_processed': min(batch_size, total_images - i)
-                })
-                
-                self.logger.info(f"Batch {batch_num} completed in {processing_time:.2f}s")
-                
-                # Small delay to avoid rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing batch {batch_num}: {e}")
-                results.append({
-                    'batch_id': batch_num,
-                    'result': None,
-                    'error': str(e),
-                    'processing_time': 0
-                })
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                lambda offset: self._process_batch(
+                    collection, process_func, offset, batch_size,
+                    offset // batch_size + 1, num_batches, total_images
+                ),
+                offsets
+            ))
         
         return results
     
-    def parallel_export_tasks(self, export_configs):
+    def _start_export(self, index, config):
+        """Create and start one export task (runs in a worker thread)."""
+        try:
+            # Create export task based on type
+            if config['type'] == 'image':
+                task = ee.batch.Export.image.toDrive(**config['params'])
+            elif config['type'] == 'table':
+                task = ee.batch.Export.table.toDrive(**config['params'])
+            elif config['type'] == 'video':
+                task = ee.batch.Export.video.toDrive(**config['params'])
+            else:
+                raise ValueError(f"Unknown export type: {config['type']}")
+            
+            # Respect the task-start quota, then start the task
+            self.export_rate_limiter.wait()
+            task.start()
+        except Exception:
+            # The task never ran, so give its slot back straight away
+            self._export_slots.release()
+            raise
+        
+        with self._active_lock:
+            self._active_exports.add(task.id)
+        
+        self.logger.info(f"Started export task {index + 1}: {task.id}")
+        
+        return task
+    
+    def _release_finished_exports(self, all_submitted, poll_interval):
+        """Free export slots as running tasks finish (runs in a watcher thread)."""
+        while not all_submitted.is_set():
+            with self._active_lock:
+                task_ids = list(self._active_exports)
+            
+            if task_ids:
+                try:
+                    for status in ee.data.getTaskStatus(task_ids):
+                        if status['state'] in ('COMPLETED', 'FAILED', 'CANCELLED'):
+                            with self._active_lock:
+                                self._active_exports.discard(status['id'])
+                            self._export_slots.release()
+                except Exception as e:
+                    self.logger.error(f"Error checking running exports: {e}")
+            
+            all_submitted.wait(poll_interval)
+    
+    def parallel_export_tasks(self, export_configs, poll_interval=30):
         """
         Create and manage multiple export tasks in parallel.
         
+        At most ``max_concurrent_exports`` tasks run at once; further tasks
+        are only started as earlier ones finish.
+        
         Args:
-            export_configs: List of export configuration dictionaries
+            export_configs: Iterable of export configuration dictionaries
+            poll_interval: Seconds between checks for finished tasks while
+                waiting for a free slot
         
         Returns:
             dict: Task IDs and their configurations
         """
-        self.logger.info(f"Creating {len(export_configs)} parallel export tasks")
+        self.logger.info(f"Creating parallel export tasks "
+                         f"(at most {self.max_concurrent_exports} running)")
         
         tasks = {}
         
-        for i, config in enumerate(export_configs):
-            try:
-                # Create export task based on type
-                if config['type'] == 'image':
-                    task = ee.batch.Export.image.toDrive(**config['params'])
-                elif config['type'] == 'table':
-                    task = ee.batch.Export.table.toDrive(**config['params'])
-                elif config['type'] == 'video':
-                    task = ee.batch.Export.video.toDrive(**config['params'])
-                else:
-                    raise ValueError(f"Unknown export type: {config['type']}")
-                
-                # Start task
-                task.start()
-                
-                tasks[task.id] = {
-                    'task': task,
-                    'config': config,
-                    'started_at': datetime.now(),
-                    'status': 'RUNNING'
-                }
-                
-                self.logger.info(f"Started export task {i+1}: {task.id}")
-                
-                # Small delay between task starts
-                time.sleep(2)
+        self._export_slots = threading.BoundedSemaphore(self.max_concurrent_exports)
+        self._active_exports = set()
+        self._active_lock = threading.Lock()
+        all_submitted = threading.Event()
+        
+        watcher = threading.Thread(
+            target=self._release_finished_exports,
+            args=(all_submitted, poll_interval),
+            daemon=True
+        )
+        watcher.start()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            
+            for i, config in enumerate(export_configs):
+                # Wait for a free slot before queueing the next export
+                self._export_slots.acquire()
+                futures[executor.submit(self._start_export, i, config)] = (i, config)
+            
+            all_submitted.set()
+            
+            for future in as_completed(futures):
+                i, config = futures[future]
                 
-            except Exception as e:
-                self.logger.error(f"Failed to create export task {i+1}: {e}")
+                try:
+                    task = future.result()
+                    
+                    tasks[task.id] = {
+                        'task': task,
+                        'config': config,
+                        'started_at': datetime.now(),
+                        'status': 'RUNNING'
+                    }
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to create export task {i+1}: {e}")
+        
+        watcher.join()
         
         return tasks
     
-    def monitor_task_progress(self, tasks, check_interval=60):
+    def monitor_task_progress(self, tasks=None, check_interval=None):
         """
         Monitor progress of running tasks.
         
+        The polling interval starts at ``check_interval`` and grows by 1.5x
+        after every round without a state change, up to ``max_poll_interval``.
+        Any completion resets it. If ``state_path`` is set, all tracked tasks
+        are saved there after each round so monitoring can resume after a crash.
+        Tasks the server reports as UNKNOWN, or omits from its reply, count as
+        finished.
+        
         Args:
             tasks: Dictionary of task IDs and configurations
-            check_interval: How often to check status (seconds)
+                (defaults to the tasks restored from ``state_path``)
+            check_interval: Initial polling interval in seconds
+                (defaults to ``min_poll_interval``)
         
         Returns:
             dict: Final status of all tasks
         """
+        if tasks is None:
+            tasks = self.tasks
+        else:
+            self.tasks.update(tasks)
+        
         self.logger.info(f"Monitoring {len(tasks)} tasks")
         
-        completed_tasks = 0
+        if check_interval is None:
+            check_interval = self.min_poll_interval
+        interval = check_interval
+        
+        # Tasks already finished in a previous run are not polled again
+        completed_tasks = sum(
+            1 for info in tasks.values()
+            if info['status'] in self._FINISHED_STATES
+        )
         total_tasks = len(tasks)
         
         while completed_tasks < total_tasks:
             self.logger.info(f"Checking task status... ({completed_tasks}/{total_tasks} completed)")
             
-            for task_id, task_info in tasks.items():
-                if task_info['status'] in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                    continue
+            # Schedule the next round from the start of this one so slow
+            # status calls do not add drift
+            next_poll = time.monotonic() + interval
+            completed_before = completed_tasks
+            
+            # Fetch the status of every unfinished task in one request
+            pending_ids = [
+                task_id for task_id, task_info in tasks.items()
+                if task_info['status'] not in self._FINISHED_STATES
+            ]
+            
+            try:
+                statuses = ee.data.getTaskStatus(pending_ids) if pending_ids else []
+            except Exception as e:
+                self.logger.error(f"Error checking task status: {e}")
+                statuses = None
+            
+            if statuses is not None:
+                # IDs missing from the reply are unknown to the server
+                returned_ids = {status['id'] for status in statuses}
+                statuses = statuses + [
+                    {'id': task_id, 'state': 'UNKNOWN'}
+                    for task_id in pending_ids if task_id not in returned_ids
+                ]
+            
+            for status in statuses or []:
+                task_id = status['id']
+                task_info = tasks[task_id]
                 
-                try:
-                    # Check task status
-                    status = task_info['task'].status()
+                if status['state'] in self._FINISHED_STATES:
+                    task_info['status'] = status['state']
+                    task_info['completed_at'] = datetime.now()
+                    completed_tasks += 1
                     
-                    if status['state'] in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                        task_info['status'] = status['state']
-                        task_info['completed_at'] = datetime.now()
-                        
-                        if status['state'] == 'COMPLETED':
-                            completed_tasks += 1
-                            self.logger.info(f"✓ Task completed: {task_id}")
-                        else:
-                            completed_tasks += 1
-                            error_msg = status.get('error_message', 'Unknown error')
-                            self.logger.error(f"✗ Task failed: {task_id} - {error_msg}")
-                
-                except Exception as e:
-                    self.logger.error(f"Error checking task {task_id}: {e}")
+                    if status['state'] == 'COMPLETED':
+                        self.logger.info(f"✓ Task completed: {task_id}")
+                    elif status['state'] == 'UNKNOWN':
+                        self.logger.warning(f"? Task unknown to the server: {task_id}")
+                    else:
+                        error_msg = status.get('error_message', 'Unknown error')
+                        self.logger.error(f"✗ Task failed: {task_id} - {error_msg}")
+            
+            self.save_state(self.tasks)
+            
+            if completed_tasks > completed_before:
+                interval = check_interval
+            else:
+                interval = min(interval * 1.5, self.max_poll_interval)
             
             if completed_tasks < total_tasks:
-                time.sleep(check_interval)
+                time.sleep(max(0, next_poll - time.monotonic()))
         
         self.logger.info("All tasks completed")
         return tasks
     
-    def time_series_batch_processing(self, region, start_date, end_date, time_step_days=16):
+    def time_series_batch_processing(self, region, start_date, end_date, time_step_days=16,
+                                     tile_scale=4):
         """
         Process time series data in temporal batches.
         
@@ -278,169 +530,237 @@ class BatchProcessor:
             start_date: Start date string
             end_date: End date string
             time_step_days: Days per time step
+            tile_scale: Split each reduction into smaller tiles (1-16) to avoid
+                running out of memory on large regions
         
         Returns:
             list: Time series results
         """
         self.logger.info(f"Processing time series from {start_date} to {end_date}")
         
-        # Create time periods
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
+        # Create time periods with vectorized date arithmetic
+        start = np.datetime64(start_date, 'D')
+        end = np.datetime64(end_date, 'D')
+        step = np.timedelta64(time_step_days, 'D')
         
-        periods = []
-        current_date = start
+        starts = np.arange(start, end, step)
+        ends = np.minimum(starts + step, end)
         
-        while current_date < end:
-            period_end = min(current_date + timedelta(days=time_step_days), end)
-            periods.append({
-                'start': current_date.strftime('%Y-%m-%d'),
-                'end': period_end.strftime('%Y-%m-%d'),
-                'period_id': len(periods) + 1
-            })
-            current_date = period_end
+        periods = [
+            {'start': period_start, 'end': period_end, 'period_id': i + 1}
+            for i, (period_start, period_end) in enumerate(zip(
+                np.datetime_as_string(starts, unit='D').tolist(),
+                np.datetime_as_string(ends, unit='D').tolist()
+            ))
+        ]
         
         self.logger.info(f"Created {len(periods)} time periods")
         
-        # Process each period
+        # Describe every period as a feature so all of them are evaluated
+        # server-side and returned by a single getInfo()
+        periods_fc = ee.FeatureCollection([
+            ee.Feature(None, {
+                'period_id': period['period_id'],
+                'start': period['start'],
+                'end': period['end']
+            })
+            for period in periods
+        ])
+        
+        # Region and quality filters are shared; only the dates vary per period
+        base_collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
+                           .filterBounds(region)
+                           .filter(ee.Filter.lt('CLOUD_COVER', 30)))
+        
+        def per_period(feature):
+            # Load collection for this period
+            collection = base_collection.filterDate(feature.get('start'), feature.get('end'))
+            
+            # Create composite from only the NDVI bands, as float
+            composite = collection.select(['SR_B5', 'SR_B4']).median().toFloat()
+            
+            # Calculate NDVI
+            ndvi = composite.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
+            
+            # Calculate statistics
+            stats = ndvi.reduceRegion(
+                reducer=ee.Reducer.mean().combine(
+                    reducer2=ee.Reducer.stdDev(),
+                    sharedInputs=True
+                ),
+                geometry=region,
+                scale=30,
+                maxPixels=1e9,
+                tileScale=tile_scale
+            )
+            
+            # Fold count and both statistics into one flat dictionary; the
+            # stats are only evaluated when the period has images, and empty
+            # periods get explicit nulls so both keys always exist
+            count = collection.size()
+            empty_stats = ee.Dictionary({'NDVI_mean': None, 'NDVI_stdDev': None})
+            stats = ee.Dictionary(ee.Algorithms.If(count.gt(0), stats, empty_stats))
+            payload = ee.Dictionary({
+                'count': count,
+                'mean': stats.get('NDVI_mean'),
+                'std': stats.get('NDVI_stdDev')
+            })
+            
+            return feature.set(payload)
+        
+        try:
+            period_features = periods_fc.map(per_period).getInfo()['features']
+        except Exception as e:
+            self.logger.error(f"✗ Error processing time series: {e}")
+            return [{
+                'period_id': period['period_id'],
+                'start_date': period['start'],
+                'end_date': period['end'],
+                'error': str(e)
+            } for period in periods]
+        
         results = []
         
-        for period in periods:
-            self.logger.info(f"Processing period {period['period_id']}: {period['start']} to {period['end']}")
+        for period, feature in zip(periods, period_features):
+            info = feature['properties']
             
-            try:
-                # Load collection for this period
-                collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                             .filterDate(period['start'], period['end'])
-                             .filterBounds(region)
-                             .filter(ee.Filter.lt('CLOUD_COVER', 30)))
-                
-                # Check if any images available
-                count = collection.size().getInfo()
-                if count == 0:
-                    self.logger.warning(f"No images found for period {period['period_id']}")
-                    continue
-                
-                # Create composite
-                composite = collection.median()
-                
-                # Calculate NDVI
-                ndvi = composite.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
-                
-                # Calculate statistics
-                stats = ndvi.reduceRegion(
-                    reducer=ee.Reducer.mean().combine(
-                        reducer2=ee.Reducer.stdDev(),
-                        sharedInputs=True
-                    ),
-                    geometry=region,
-                    scale=30,
-                    maxPixels=1e9
-                )
-                
-                result = {
-                    'period_id': period['period_id'],
-                    'start_date': period['start'],
-                    'end_date': period['end'],
-                    'image_count': count,
-                    'ndvi_mean': stats.getInfo().get('NDVI_mean'),
-                    'ndvi_stddev': stats.getInfo().get('NDVI_stdDev')
-                }
-                
-                results.append(result)
-                self.logger.info(f"✓ Period {period['period_id']} processed successfully")
-                
-            except Exception as e:
-                self.logger.error(f"✗ Error processing period {period['period_id']}: {e}")
-                results.append({
-                    'period_id': period['period_id'],
-                    'start_date': period['start'],
-                    'end_date': period['end'],
-                    'error': str(e)
-                })
+            count = info['count']
+            if count == 0:
+                self.logger.warning(f"No images found for period {period['period_id']}")
+                continue
+            
+            results.append({
+                'period_id': period['period_id'],
+                'start_date': period['start'],
+                'end_date': period['end'],
+                'image_count': count,
+                'ndvi_mean': info.get('mean'),
+                'ndvi_stddev': info.get('std')
+            })
+            self.logger.info(f"✓ Period {period['period_id']} processed successfully")
         
         return results
     
-    def large_scale_classification(self, training_data, region_grid, output_folder):
+    def iter_grid_pages(self, region_grid, page_size=1000):
         """
-        Perform classification across a large region using grid-based processing.
+        Yield pages of grid tiles instead of downloading the whole grid.
         
         Args:
-            training_data: Training feature collection
             region_grid: Grid of processing tiles
-            output_folder: Output folder for results
+            page_size: Number of tiles fetched per request
         
-        Returns:
-            list: Export task configurations
+        Yields:
+            list: GeoJSON features of up to ``page_size`` tiles
         """
-        self.logger.info("Starting large-scale classification")
+        offset = 0
         
-        # Prepare classifier
-        def train_classifier():
-            """Train random forest classifier."""
-            # Load recent Landsat collection
-            collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                         .filterDate('2023-01-01', '2023-12-31')
-                         .filter(ee.Filter.lt('CLOUD_COVER', 10))
-                         .median())
-            
-            # Calculate spectral indices
-            ndvi = collection.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
-            ndwi = collection.normalizedDifference(['SR_B3', 'SR_B5']).rename('NDWI')
+        while True:
+            page = ee.FeatureCollection(
+                region_grid.toList(page_size, offset)
+            ).getInfo()['features']
             
-            # Create feature image
-            features = collection.select(['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7']).addBands([ndvi, ndwi])
+            if page:
+                yield page
             
-            # Sample training data
-            training = features.sampleRegions(
-                collection=training_data,
-                properties=['landcover'],
-                scale=30
-            )
-            
-            # Train classifier
-            classifier = ee.Classifier.smileRandomForest(100).train(
-                features=training,
-                classProperty='landcover',
-                inputProperties=features.bandNames()
-            )
-            
-            return features, classifier
+            if len(page) < page_size:
+                return
+            offset += page_size
+    
+    def iter_grid_tiles(self, region_grid, page_size=1000):
+        """
+        Yield grid tiles one at a time, fetched page by page.
         
-        features, classifier = train_classifier()
+        Args:
+            region_grid: Grid of processing tiles
+            page_size: Number of tiles fetched per request
         
-        # Get grid tiles
-        grid_list = region_grid.getInfo()['features']
-        self.logger.info(f"Processing {len(grid_list)} grid tiles")
+        Yields:
+            dict: GeoJSON feature of one tile
+        """
+        for page in self.iter_grid_pages(region_grid, page_size):
+            yield from page
+    
+    def _train_classifier(self, training_data, date_range, cloud_cover=10):
+        """
+        Train a random forest classifier, reusing a cached one for the same inputs.
         
-        # Create export configurations for each tile
-        export_configs = []
+        Args:
+            training_data: Training feature collection
+            date_range: (start, end) dates of the composite used for features
+            cloud_cover: Maximum scene cloud cover percentage
         
-        for i, tile_feature in enumerate(grid_list):
-            tile_geom = ee.Geometry(tile_feature['geometry'])
-            tile_id = tile_feature['properties']['tile_id']
-            
-            # Classify tile
-            tile_features = features.clip(tile_geom)
-            classified = tile_features.classify(classifier).select(['classification'])
-            
-            # Create export configuration
-            export_config = {
-                'type': 'image',
-                'params': {
-                    'image': classified,
-                    'description': f'classification_tile_{tile_id}',
-                    'folder': output_folder,
-                    'region': tile_geom,
-                    'scale': 30,
-                    'crs': 'EPSG:4326',
-                    'maxPixels': 1e13
-                }
-            }
-            
-            export_configs.append(export_config)
+        Returns:
+            tuple: (feature image, trained classifier)
+        """
+        key = (id(training_data), tuple(date_range), cloud_cover)
+        if key in self._classifier_cache:
+            self.logger.info("Reusing cached classifier")
+            return self._classifier_cache[key]
+        
+        # Load recent Landsat collection
+        collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
+                     .filterDate(*date_range)
+                     .filter(ee.Filter.lt('CLOUD_COVER', cloud_cover))
+                     .median())
+        
+        # Calculate spectral indices
+        ndvi = collection.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
+        ndwi = collection.normalizedDifference(['SR_B3', 'SR_B5']).rename('NDWI')
+        
+        # Create feature image
+        features = collection.select(['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7']).addBands([ndvi, ndwi])
+        
+        # Sample training data
+        training = features.sampleRegions(
+            collection=training_data,
+            properties=['landcover'],
+            scale=30
+        )
+        
+        # Train classifier
+        classifier = ee.Classifier.smileRandomForest(100).train(
+            features=training,
+            classProperty='landcover',
+            inputProperties=features.bandNames()
+        )
+        
+        self._classifier_cache[key] = (features, classifier)
+        return features, classifier
+    
+    def large_scale_classification(self, training_data, region_grid, output_folder,
+                                   page_size=1000, date_range=('2023-01-01', '2023-12-31')):
+        """
+        Perform classification across a large region using grid-based processing.
+        
+        Export configurations are generated lazily while tiles are fetched page
+        by page, so memory stays bounded for very large grids.
+        
+        Args:
+            training_data: Training feature collection
+            region_grid: Grid of processing tiles
+            output_folder: Output folder for results
+            page_size: Number of tiles fetched per request
+            date_range: (start, end) dates of the composite used for features
+        
+        Yields:
+            dict: Export task configuration for one tile
+        """
+        self.logger.info("Starting large-scale classification")
+        
+        features, classifier = self._train_classifier(training_data, date_range)
+        
+        # Classify once; each export is limited to its tile by the export region
+        classified = features.classify(classifier).select(['classification'])
+        
+        # Build export configurations page by page as the tiles are fetched
+        build_config = partial(
+            _build_export_config,
+            classified=classified,
+            output_folder=output_folder
+        )
         
-        return export_configs
+        for page in self.iter_grid_pages(region_grid, page_size):
+            yield from map(build_config, page)
     
     def optimize_memory_usage(self):
         """Implement memory optimization strategies."""
@@ -490,8 +810,8 @@ def main():
     print("\n1️⃣ Grid-Based Processing")
     print("-" * 30)
     
-    processing_grid = processor.create_processing_grid(study_region, grid_size=2.0)
-    print(f"✓ Created processing grid with {processing_grid.size().getInfo()} tiles")
+    processing_grid, num_tiles = processor.create_processing_grid(study_region, grid_size=2.0)
+    print(f"✓ Created processing grid with {num_tiles} tiles")
     
     # Example 2: Batch collection processing
     print("\n2️⃣ Batch Collection Processing")
@@ -505,14 +825,16 @@ def main():
     
     def calculate_ndvi_stats(batch):
         """Calculate NDVI statistics for a batch of images."""
-        composite = batch.median()
+        composite = batch.select(['SR_B5', 'SR_B4']).median().toFloat()
         ndvi = composite.normalizedDifference(['SR_B5', 'SR_B4'])
         
         stats = ndvi.reduceRegion(
             reducer=ee.Reducer.mean(),
             geometry=study_region.centroid().buffer(50000),
             scale=30,
-            maxPixels=1e6
+            maxPixels=1e6,
+            bestEffort=True,
+            tileScale=4
         )
         
         return stats.get('nd')
@@ -621,7 +943,7 @@ def main():
     print("• Performance monitoring and logging")
     
     print("\n📈 Processing Statistics:")
-    print(f"• Processing grid: {processing_grid.size().getInfo()} tiles")
+    print(f"• Processing grid: {num_tiles} tiles")
     print(f"• Collection batches: {len(batch_results)} processed")
     print(f"• Time series periods: {len(time_series_results)} analyzed")
     print(f"• Export tasks configured: {len(sample_exports)}")
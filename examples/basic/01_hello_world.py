@@ -30,19 +30,21 @@ def main():
     # Get a simple image from the catalog
     image = ee.Image('USGS/SRTMGL1_003')
     
+    # Fetch the image metadata once and read everything from it
+    info = image.getInfo()
+    band = info['bands'][0]
+    
     # Print basic image information
-    print(f"Image ID: {image.getInfo()['id']}")
-    print(f"Image type: {image.getInfo()['type']}")
+    print(f"Image ID: {info['id']}")
+    print(f"Image type: {info['type']}")
     
     # Get image properties
-    properties = image.propertyNames()
-    print(f"Image properties: {properties.getInfo()}")
+    print(f"Image properties: {list(info.get('properties', {}).keys())}")
     
-    # Get projection information
-    projection = image.projection()
-    print(f"Projection: {projection.getInfo()}")
+    # Get projection information (stored with each band)
+    print(f"Projection: {band['crs']} {band['crs_transform']}")
     
-    # Get image scale (resolution)
+    # Get image scale (resolution); meters need a server-side computation
     scale = image.projection().nominalScale()
     print(f"Scale (meters): {scale.getInfo()}")
     
@@ -14,10 +14,48 @@ Prerequisites:
 - Understanding of remote sensing basics
 """
 
+import functools
+import types
+from concurrent.futures import ThreadPoolExecutor
+
 import ee
 import folium
 import numpy as np
 
+# Endpoint for automated, high request-rate use (getInfo, getMapId, reduceRegion)
+HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+# Band combinations for Landsat 8 display (read-only, shared by all calls)
+_VISUALIZATIONS = types.MappingProxyType({
+    'true_color': types.MappingProxyType({
+        'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
+        'min': 0.0,
+        'max': 0.3,
+        'description': 'True Color (Red, Green, Blue)'
+    }),
+    'false_color': types.MappingProxyType({
+        'bands': ['SR_B5', 'SR_B4', 'SR_B3'],
+        'min': 0.0,
+        'max': 0.3,
+        'description': 'False Color Infrared (NIR, Red, Green)'
+    }),
+    'agriculture': types.MappingProxyType({
+        'bands': ['SR_B6', 'SR_B5', 'SR_B2'],
+        'min': 0.0,
+        'max': 0.3,
+        'description': 'Agriculture (SWIR1, NIR, Blue)'
+    }),
+    'urban': types.MappingProxyType({
+        'bands': ['SR_B7', 'SR_B6', 'SR_B4'],
+        'min': 0.0,
+        'max': 0.3,
+        'description': 'Urban (SWIR2, SWIR1, Red)'
+    })
+})
+
+# image.getInfo() results keyed by the serialized image graph
+_band_info_cache = {}
+
 def display_single_band_image():
     """
     Display a single-band image with custom visualization.
@@ -27,9 +65,17 @@ def display_single_band_image():
     # Load elevation data (single band)
     elevation = ee.Image('USGS/SRTMGL1_003')
     
+    # Fetch all metadata in a single request
+    metadata = ee.Dictionary({
+        'id': elevation.get('system:id'),
+        'bands': elevation.bandNames(),
+        'properties': elevation.propertyNames(),
+        'projection': elevation.projection()
+    }).getInfo()
+    
     # Print basic information
-    print(f"Image ID: {elevation.get('system:id').getInfo()}")
-    print(f"Band names: {elevation.bandNames().getInfo()}")
+    print(f"Image ID: {metadata['id']}")
+    print(f"Band names: {metadata['bands']}")
     
     # Define visualization parameters
     vis_params = {
@@ -39,12 +85,10 @@ def display_single_band_image():
     }
     
     # Get image properties
-    properties = elevation.propertyNames()
-    print(f"Available properties: {properties.getInfo()}")
+    print(f"Available properties: {metadata['properties']}")
     
     # Get projection info
-    projection = elevation.projection()
-    print(f"Projection: {projection.getInfo()}")
+    print(f"Projection: {metadata['projection']}")
     
     return elevation, vis_params
 
@@ -61,46 +105,62 @@ def display_multi_band_image():
                .sort('CLOUD_COVER')
                .first())
     
-    print(f"Scene ID: {landsat.get('LANDSAT_PRODUCT_ID').getInfo()}")
-    print(f"Cloud cover: {landsat.get('CLOUD_COVER').getInfo()}%")
-    print(f"Date: {landsat.get('DATE_ACQUIRED').getInfo()}")
-    
-    # Define different visualization combinations
-    visualizations = {
-        'true_color': {
-            'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
-            'min': 0.0,
-            'max': 0.3,
-            'description': 'True Color (Red, Green, Blue)'
-        },
-        'false_color': {
-            'bands': ['SR_B5', 'SR_B4', 'SR_B3'],
-            'min': 0.0,
-            'max': 0.3,
-            'description': 'False Color Infrared (NIR, Red, Green)'
-        },
-        'agriculture': {
-            'bands': ['SR_B6', 'SR_B5', 'SR_B2'],
-            'min': 0.0,
-            'max': 0.3,
-            'description': 'Agriculture (SWIR1, NIR, Blue)'
-        },
-        'urban': {
-            'bands': ['SR_B7', 'SR_B6', 'SR_B4'],
-            'min': 0.0,
-            'max': 0.3,
-            'description': 'Urban (SWIR2, SWIR1, Red)'
-        }
-    }
+    scene = ee.Dictionary({
+        'id': landsat.get('LANDSAT_PRODUCT_ID'),
+        'cloud_cover': landsat.get('CLOUD_COVER'),
+        'date': landsat.get('DATE_ACQUIRED')
+    }).getInfo()
+    
+    print(f"Scene ID: {scene['id']}")
+    print(f"Cloud cover: {scene['cloud_cover']}%")
+    print(f"Date: {scene['date']}")
     
-    return landsat, visualizations
+    return landsat, _VISUALIZATIONS
+
+def _freeze_vis_params(vis_params):
+    """
+    Turn visualization parameters into a hashable cache key.
+    
+    Display-only keys such as 'description' are dropped since getMapId
+    does not accept them.
+    
+    Args:
+        vis_params: Visualization parameters
+    
+    Returns:
+        tuple: Sorted (key, value) pairs with lists converted to tuples
+    """
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in vis_params.items()
+        if key != 'description'
+    ))
+
+@functools.lru_cache(maxsize=128)
+def _get_tile_url(serialized_image, frozen_vis):
+    """
+    Fetch (and cache) the tile URL for an image and visualization.
+    
+    Args:
+        serialized_image: Output of ee.Image.serialize()
+        frozen_vis: Output of _freeze_vis_params()
+    
+    Returns:
+        str: Tile URL format for map layers
+    """
+    vis_params = {key: list(value) if isinstance(value, tuple) else value
+                  for key, value in frozen_vis}
+    image = ee.Image(ee.deserializer.fromJSON(serialized_image))
+    return image.getMapId(vis_params)['tile_fetcher'].url_format
 
 def create_folium_map(image, vis_params, center_coords, zoom_level=10):
     """
     Create an interactive map using Folium to display Earth Engine images.
     
     Args:
-        image: Earth Engine image
+        image: Earth Engine image, or its serialize() output. When mapping
+            several visualizations of one image, serialize it once and pass
+            the string so the graph is not re-encoded per layer.
         vis_params: Visualization parameters
         center_coords: [latitude, longitude] for map center
         zoom_level: Initial zoom level
@@ -117,12 +177,13 @@ def create_folium_map(image, vis_params, center_coords, zoom_level=10):
         control_scale=True
     )
     
-    # Get the tile URL for the Earth Engine image
-    map_id_dict = ee.Image(image).getMapId(vis_params)
+    # Get the tile URL for the Earth Engine image (cached per image/vis pair)
+    serialized = image if isinstance(image, str) else ee.Image(image).serialize()
+    tile_url = _get_tile_url(serialized, _freeze_vis_params(vis_params))
     
     # Add Earth Engine layer to map
     folium.raster_layers.TileLayer(
-        tiles=map_id_dict['tile_fetcher'].url_format,
+        tiles=tile_url,
         attr='Google Earth Engine',
         name='EE Image',
         overlay=True,
@@ -134,13 +195,48 @@ def create_folium_map(image, vis_params, center_coords, zoom_level=10):
     
     return m
 
-def analyze_image_statistics(image, geometry=None):
+def _band_info(image):
+    """
+    Fetch (and cache) the full metadata of an image.
+    
+    Args:
+        image: Earth Engine image
+    
+    Returns:
+        dict: Result of image.getInfo(), including the 'bands' list
+    """
+    key = image.serialize()
+    if key not in _band_info_cache:
+        _band_info_cache[key] = image.getInfo()
+    return _band_info_cache[key]
+
+@functools.lru_cache(maxsize=None)
+def _summary_reducer():
+    """
+    Combined min/max, mean, stdDev and quartile reducer.
+    
+    Returns:
+        ee.Reducer: Reducer producing all summary statistics in one pass
+    """
+    return (ee.Reducer.minMax()
+            .combine(reducer2=ee.Reducer.mean(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.stdDev(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.percentile([25, 75]), sharedInputs=True))
+
+def analyze_image_statistics(image, geometry=None, bands=None, scale=30,
+                             tile_scale=4, best_effort=True):
     """
     Calculate and display basic statistics for an image.
     
     Args:
         image: Earth Engine image
         geometry: Optional geometry for regional statistics
+        bands: Optional list of bands to analyze (all bands if None)
+        scale: Scale for analysis
+        tile_scale: Tile scale for the reduction (higher uses smaller tiles
+            and avoids out-of-memory errors on large regions)
+        best_effort: Coarsen the scale instead of failing when the region
+            exceeds maxPixels
     
     Returns:
         dict: Dictionary containing statistics
@@ -150,32 +246,35 @@ def analyze_image_statistics(image, geometry=None):
     if geometry is None:
         # Use image footprint if no geometry provided
         geometry = image.geometry()
+    else:
+        # Clip to the requested region so only tiles inside it are read
+        image = image.clip(geometry)
     
-    # Calculate statistics
+    if bands is not None:
+        image = image.select(bands)
+    
+    # Calculate statistics for every band of the stack in one pass
     stats = image.reduceRegion(
-        reducer=ee.Reducer.minMax().combine(
-            reducer2=ee.Reducer.mean(),
-            sharedInputs=True
-        ).combine(
-            reducer2=ee.Reducer.stdDev(),
-            sharedInputs=True
-        ),
+        reducer=_summary_reducer(),
         geometry=geometry,
-        scale=30,
-        maxPixels=1e9
+        scale=scale,
+        maxPixels=1e9,
+        tileScale=tile_scale,
+        bestEffort=best_effort
     )
     
     stats_dict = stats.getInfo()
     
     # Print formatted statistics
     print("\n📈 Image Statistics:")
-    for key, value in stats_dict.items():
+    for key, value in sorted(stats_dict.items()):
         if value is not None:
             print(f"  {key}: {value:.4f}")
     
     return stats_dict
 
-def create_histogram_data(image, band_name, geometry=None, scale=30):
+def create_histogram_data(image, band_name, geometry=None, scale=30,
+                          tile_scale=4, best_effort=True):
     """
     Create histogram data for a specific band.
     
@@ -184,9 +283,13 @@ def create_histogram_data(image, band_name, geometry=None, scale=30):
         band_name: Name of the band to analyze
         geometry: Optional geometry for regional analysis
         scale: Scale for analysis
+        tile_scale: Tile scale for the reduction (higher uses smaller tiles
+            and avoids out-of-memory errors on large regions)
+        best_effort: Coarsen the scale instead of failing when the region
+            exceeds maxPixels
     
     Returns:
-        dict: Histogram data
+        dict: Bucket means and counts as NumPy arrays, plus the bucket width
     """
     print(f"📊 Creating histogram for band: {band_name}")
     
@@ -198,11 +301,19 @@ def create_histogram_data(image, band_name, geometry=None, scale=30):
         reducer=ee.Reducer.histogram(maxBuckets=256),
         geometry=geometry,
         scale=scale,
-        maxPixels=1e9
+        maxPixels=1e9,
+        tileScale=tile_scale,
+        bestEffort=best_effort
     )
     
-    hist_data = histogram.getInfo()
-    return hist_data
+    hist_data = histogram.getInfo().get(band_name) or {}
+    
+    # Convert to arrays once so PDF/CDF/threshold math stays vectorized
+    return {
+        'means': np.asarray(hist_data.get('bucketMeans', []), dtype=np.float64),
+        'counts': np.asarray(hist_data.get('histogram', []), dtype=np.float64),
+        'width': hist_data.get('bucketWidth')
+    }
 
 def apply_cloud_masking(image):
     """
@@ -219,9 +330,8 @@ def apply_cloud_masking(image):
     # Get QA band
     qa = image.select('QA_PIXEL')
     
-    # Create cloud mask
-    cloud_mask = qa.bitwiseAnd(1 << 3).eq(0).And(  # Cloud shadow
-                 qa.bitwiseAnd(1 << 4).eq(0))       # Cloud
+    # Create cloud mask: cloud (bit 3) and cloud shadow (bit 4) must both be clear
+    cloud_mask = qa.bitwiseAnd((1 << 3) | (1 << 4)).eq(0).toUint8()
     
     # Apply mask and scale
     masked_image = image.updateMask(cloud_mask).multiply(0.0000275).add(-0.2)
@@ -234,7 +344,7 @@ def main():
     """
     # Initialize Earth Engine
     try:
-        ee.Initialize(project='your-project-id')
+        ee.Initialize(project='your-project-id', opt_url=HIGH_VOLUME_URL)
         print("✓ Earth Engine initialized successfully!")
     except Exception as e:
         print(f"✗ Error initializing Earth Engine: {e}")
@@ -271,35 +381,43 @@ def main():
     # Example 4: Image properties and metadata
     print("\n4️⃣ Image Properties and Metadata")
     
-    # Get all properties
-    all_properties = landsat.propertyNames().getInfo()
-    print(f"Total properties: {len(all_properties)}")
-    
     # Display key properties
     key_properties = [
         'LANDSAT_PRODUCT_ID', 'DATE_ACQUIRED', 'CLOUD_COVER',
         'SUN_ELEVATION', 'SUN_AZIMUTH', 'EARTH_SUN_DISTANCE'
     ]
     
+    # The property, key property and band metadata requests are independent,
+    # so issue them concurrently and collect the results as they are needed
+    executor = ThreadPoolExecutor(max_workers=3)
+    all_properties_future = executor.submit(lambda: landsat.propertyNames().getInfo())
+    # Missing key properties are dropped by toDictionary
+    key_values_future = executor.submit(lambda: landsat.toDictionary(key_properties).getInfo())
+    band_info_future = executor.submit(_band_info, landsat_masked)
+    executor.shutdown(wait=False)
+    
+    # Get all properties
+    all_properties = all_properties_future.result()
+    print(f"Total properties: {len(all_properties)}")
+    
+    key_values = key_values_future.result()
+    
     print("\n🔍 Key Image Properties:")
     for prop in key_properties:
-        try:
-            value = landsat.get(prop).getInfo()
-            print(f"  {prop}: {value}")
-        except:
-            print(f"  {prop}: Not available")
+        value = key_values.get(prop)
+        print(f"  {prop}: {value if value is not None else 'Not available'}")
     
     # Example 5: Band information
     print("\n5️⃣ Band Information")
-    band_names = landsat_masked.bandNames().getInfo()
-    print(f"Available bands: {band_names}")
+    # One metadata request covers the band list and every band's details
+    bands_by_id = {band['id']: band for band in band_info_future.result()['bands']}
+    print(f"Available bands: {list(bands_by_id)}")
     
     # Get band-specific information
     for band in ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5']:
-        try:
-            band_info = landsat_masked.select(band).getInfo()
-            print(f"  {band}: {band_info['bands'][0]['id']}")
-        except:
+        if band in bands_by_id:
+            print(f"  {band}: {bands_by_id[band]['id']}")
+        else:
             print(f"  {band}: Information not available")
     
     # Example 6: Create interactive map
@@ -15,14 +15,91 @@ Prerequisites:
 - Familiarity with spectral indices
 """
 
+import functools
+import re
+import types
+
 import ee
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
-def demonstrate_basic_math():
+# Endpoint for automated, high request-rate use (getInfo, getMapId, reduceRegion)
+HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+# Output band order of calculate_spectral_indices
+_INDEX_BAND_ORDER = ('NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI', 'MNDWI', 'NBR')
+
+# Expression templates; variables are band roles resolved per sensor
+_EXPR_EVI = '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))'
+_EXPR_SAVI = '((NIR - RED) / (NIR + RED + 0.5)) * (1.5)'
+_EXPR_CUSTOM_VI = '(NIR * 2.5 - RED * 1.5 - BLUE * 0.8) / (NIR + RED + BLUE)'
+_EXPR_VISIBILITY = 'BLUE / RED'
+_EXPR_SOIL_BRIGHTNESS = '(BLUE + GREEN + RED) / 3'
+_EXPR_SHADOW = '(BLUE + GREEN) / (NIR + SWIR1)'
+
+# Band name for each role, per sensor
+_SENSOR_BANDS = types.MappingProxyType({
+    'L8': {'BLUE': 'SR_B2', 'GREEN': 'SR_B3', 'RED': 'SR_B4',
+           'NIR': 'SR_B5', 'SWIR1': 'SR_B6', 'SWIR2': 'SR_B7'},
+    'L9': {'BLUE': 'SR_B2', 'GREEN': 'SR_B3', 'RED': 'SR_B4',
+           'NIR': 'SR_B5', 'SWIR1': 'SR_B6', 'SWIR2': 'SR_B7'},
+    'S2': {'BLUE': 'B2', 'GREEN': 'B3', 'RED': 'B4',
+           'NIR': 'B8', 'SWIR1': 'B11', 'SWIR2': 'B12'}
+})
+
+# Bands written by the export example
+_EXPORT_BANDS = (
+    'SR_B4', 'SR_B3', 'SR_B2',  # RGB bands
+    'NDVI', 'NDWI', 'EVI',      # Vegetation indices
+    'Land_Cover'                 # Classification
+)
+
+# Visualization parameters by layer (read-only, shared by all calls)
+_VIS_PARAMS = types.MappingProxyType({
+    'true_color': types.MappingProxyType({
+        'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
+        'min': 0.0,
+        'max': 0.3,
+        'gamma': 1.2
+    }),
+    'false_color': types.MappingProxyType({
+        'bands': ['SR_B5', 'SR_B4', 'SR_B3'],
+        'min': 0.0,
+        'max': 0.3,
+        'gamma': 1.2
+    }),
+    'ndvi': types.MappingProxyType({
+        'bands': ['NDVI'],
+        'min': -0.2,
+        'max': 0.8,
+        'palette': ['blue', 'white', 'green']
+    }),
+    'ndwi': types.MappingProxyType({
+        'bands': ['NDWI'],
+        'min': -0.3,
+        'max': 0.5,
+        'palette': ['white', 'blue']
+    }),
+    'land_cover': types.MappingProxyType({
+        'bands': ['Land_Cover'],
+        'min': 0,
+        'max': 3,
+        'palette': ['gray', 'blue', 'green', 'red']
+    })
+})
+
+def demonstrate_basic_math(materialize=False):
     """
     Demonstrate basic mathematical operations on Earth Engine images.
+    
+    Args:
+        materialize: Build the example operations and add them as bands.
+            When False (the default) only the scaled image is built, since
+            the demonstration results are never fetched.
+    
+    Returns:
+        ee.Image: Scaled Landsat 8 image (with the example bands if materialized)
     """
     print("🧮 Basic Mathematical Operations")
     print("-" * 40)
@@ -48,41 +125,70 @@ def demonstrate_basic_math():
     
     # Basic arithmetic operations
     print("\n📊 Basic Arithmetic Operations:")
-    
-    # Addition
-    red_plus_nir = image.select('SR_B4').add(image.select('SR_B5'))
     print("✓ Addition: Red + NIR")
-    
-    # Subtraction  
-    nir_minus_red = image.select('SR_B5').subtract(image.select('SR_B4'))
     print("✓ Subtraction: NIR - Red")
-    
-    # Multiplication
-    red_times_nir = image.select('SR_B4').multiply(image.select('SR_B5'))
     print("✓ Multiplication: Red × NIR")
-    
-    # Division
-    nir_div_red = image.select('SR_B5').divide(image.select('SR_B4'))
     print("✓ Division: NIR ÷ Red")
-    
-    # Constants
-    red_plus_constant = image.select('SR_B4').add(0.1)
-    red_times_constant = image.select('SR_B4').multiply(2.0)
     print("✓ Operations with constants")
-    
-    # Power operations
-    red_squared = image.select('SR_B4').pow(2)
-    red_sqrt = image.select('SR_B4').sqrt()
     print("✓ Power operations: square and square root")
     
-    return image
+    if not materialize:
+        return image
+    
+    # Build all example operations as one multi-band image
+    red = image.select('SR_B4')
+    nir = image.select('SR_B5')
+    math_bands = ee.Image.cat([
+        red.add(nir),        # Addition
+        nir.subtract(red),   # Subtraction
+        red.multiply(nir),   # Multiplication
+        nir.divide(red),     # Division
+        red.add(0.1),        # Constant addition
+        red.multiply(2.0),   # Constant multiplication
+        red.multiply(red),   # Square
+        red.sqrt()           # Square root
+    ]).rename([
+        'Red_Plus_NIR', 'NIR_Minus_Red', 'Red_Times_NIR', 'NIR_Div_Red',
+        'Red_Plus_Constant', 'Red_Times_Constant', 'Red_Squared', 'Red_Sqrt'
+    ])
+    
+    return image.addBands(math_bands)
 
-def calculate_spectral_indices(image):
+def build_indices_expr(sensor='L8'):
+    """
+    Map the band roles used in the index expressions to a sensor's bands.
+    
+    Args:
+        sensor: Sensor key ('L8', 'L9' or 'S2')
+    
+    Returns:
+        dict: Band name for each role (BLUE, GREEN, RED, NIR, SWIR1, SWIR2)
+    """
+    if sensor not in _SENSOR_BANDS:
+        raise ValueError(f"Unknown sensor: {sensor}")
+    return dict(_SENSOR_BANDS[sensor])
+
+def _expression_inputs(expression, roles):
+    """
+    Pick the role images an expression actually references.
+    
+    Args:
+        expression: Expression template using role names as variables
+        roles: Dictionary of role name to single-band image
+    
+    Returns:
+        dict: Subset of roles used by the expression
+    """
+    return {role: band for role, band in roles.items()
+            if re.search(rf'\b{role}\b', expression)}
+
+def calculate_spectral_indices(image, sensor='L8'):
     """
     Calculate common spectral indices for vegetation and water analysis.
     
     Args:
-        image: Landsat 8 image (scaled)
+        image: Scaled surface reflectance image
+        sensor: Sensor key used to resolve band roles ('L8', 'L9' or 'S2')
     
     Returns:
         ee.Image: Image with spectral indices added as bands
@@ -90,65 +196,48 @@ def calculate_spectral_indices(image):
     print("\n🌱 Calculating Spectral Indices")
     print("-" * 40)
     
-    # NDVI (Normalized Difference Vegetation Index)
-    # NDVI = (NIR - Red) / (NIR + Red)
-    ndvi = image.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
-    print("✓ NDVI calculated")
+    # Select each band role once
+    roles = {role: image.select(band) for role, band in build_indices_expr(sensor).items()}
+    blue, green, red, nir, swir1, swir2 = [
+        roles[role] for role in ['BLUE', 'GREEN', 'RED', 'NIR', 'SWIR1', 'SWIR2']
+    ]
     
-    # NDWI (Normalized Difference Water Index)
-    # NDWI = (Green - NIR) / (Green + NIR)
-    ndwi = image.normalizedDifference(['SR_B3', 'SR_B5']).rename('NDWI')
-    print("✓ NDWI calculated")
-    
-    # NDBI (Normalized Difference Built-up Index)
-    # NDBI = (SWIR1 - NIR) / (SWIR1 + NIR)
-    ndbi = image.normalizedDifference(['SR_B6', 'SR_B5']).rename('NDBI')
-    print("✓ NDBI calculated")
+    # Normalized differences (A - B) / (A + B), all five pairs in one stacked op:
+    # NDVI  = (NIR - Red) / (NIR + Red)
+    # NDWI  = (Green - NIR) / (Green + NIR)
+    # NDBI  = (SWIR1 - NIR) / (SWIR1 + NIR)
+    # MNDWI = (Green - SWIR1) / (Green + SWIR1)
+    # NBR   = (NIR - SWIR2) / (NIR + SWIR2)
+    first = ee.Image.cat([nir, green, swir1, green, nir])
+    second = ee.Image.cat([red, nir, nir, swir1, swir2])
+    normalized = (first.subtract(second)
+                  .divide(first.add(second))
+                  .rename(['NDVI', 'NDWI', 'NDBI', 'MNDWI', 'NBR']))
+    print("✓ NDVI, NDWI, NDBI, MNDWI and NBR calculated")
     
     # EVI (Enhanced Vegetation Index)
     # EVI = 2.5 * ((NIR - Red) / (NIR + 6 * Red - 7.5 * Blue + 1))
-    evi = image.expression(
-        '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))',
-        {
-            'NIR': image.select('SR_B5'),
-            'RED': image.select('SR_B4'),
-            'BLUE': image.select('SR_B2')
-        }
-    ).rename('EVI')
+    evi = image.expression(_EXPR_EVI, _expression_inputs(_EXPR_EVI, roles)).rename('EVI')
     print("✓ EVI calculated")
     
     # SAVI (Soil Adjusted Vegetation Index)
     # SAVI = ((NIR - Red) / (NIR + Red + L)) * (1 + L), where L = 0.5
-    savi = image.expression(
-        '((NIR - RED) / (NIR + RED + 0.5)) * (1.5)',
-        {
-            'NIR': image.select('SR_B5'),
-            'RED': image.select('SR_B4')
-        }
-    ).rename('SAVI')
+    savi = image.expression(_EXPR_SAVI, _expression_inputs(_EXPR_SAVI, roles)).rename('SAVI')
     print("✓ SAVI calculated")
     
-    # MNDWI (Modified Normalized Difference Water Index)
-    # MNDWI = (Green - SWIR1) / (Green + SWIR1)
-    mndwi = image.normalizedDifference(['SR_B3', 'SR_B6']).rename('MNDWI')
-    print("✓ MNDWI calculated")
-    
-    # NBR (Normalized Burn Ratio)
-    # NBR = (NIR - SWIR2) / (NIR + SWIR2)
-    nbr = image.normalizedDifference(['SR_B5', 'SR_B7']).rename('NBR')
-    print("✓ NBR calculated")
-    
     # Add all indices to the image
-    indices_image = image.addBands([ndvi, ndwi, ndbi, evi, savi, mndwi, nbr])
+    indices = ee.Image.cat([normalized, evi, savi]).select(list(_INDEX_BAND_ORDER))
+    indices_image = image.addBands(indices)
     
     return indices_image
 
-def create_custom_calculations(image):
+def create_custom_calculations(image, sensor='L8'):
     """
     Demonstrate custom calculations using ee.Image.expression().
     
     Args:
         image: Input Earth Engine image
+        sensor: Sensor key used to resolve band roles ('L8', 'L9' or 'S2')
     
     Returns:
         ee.Image: Image with custom calculated bands
@@ -156,49 +245,31 @@ def create_custom_calculations(image):
     print("\n🔬 Custom Calculations with ee.Image.expression()")
     print("-" * 50)
     
+    roles = {role: image.select(band) for role, band in build_indices_expr(sensor).items()}
+    
     # Custom vegetation index combining multiple bands
     custom_vi = image.expression(
-        '(NIR * 2.5 - RED * 1.5 - BLUE * 0.8) / (NIR + RED + BLUE)',
-        {
-            'NIR': image.select('SR_B5'),
-            'RED': image.select('SR_B4'),
-            'BLUE': image.select('SR_B2')
-        }
+        _EXPR_CUSTOM_VI, _expression_inputs(_EXPR_CUSTOM_VI, roles)
     ).rename('Custom_VI')
     print("✓ Custom vegetation index")
     
     # Atmospheric visibility index
     # Uses the ratio of blue to red for atmospheric clarity
     visibility_index = image.expression(
-        'BLUE / RED',
-        {
-            'BLUE': image.select('SR_B2'),
-            'RED': image.select('SR_B4')
-        }
+        _EXPR_VISIBILITY, _expression_inputs(_EXPR_VISIBILITY, roles)
     ).rename('Visibility_Index')
     print("✓ Atmospheric visibility index")
     
     # Soil brightness index
     # Average of visible bands
     soil_brightness = image.expression(
-        '(BLUE + GREEN + RED) / 3',
-        {
-            'BLUE': image.select('SR_B2'),
-            'GREEN': image.select('SR_B3'),
-            'RED': image.select('SR_B4')
-        }
+        _EXPR_SOIL_BRIGHTNESS, _expression_inputs(_EXPR_SOIL_BRIGHTNESS, roles)
     ).rename('Soil_Brightness')
     print("✓ Soil brightness index")
     
     # Shadow index (using multiple bands)
     shadow_index = image.expression(
-        '(BLUE + GREEN) / (NIR + SWIR1)',
-        {
-            'BLUE': image.select('SR_B2'),
-            'GREEN': image.select('SR_B3'),
-            'NIR': image.select('SR_B5'),
-            'SWIR1': image.select('SR_B6')
-        }
+        _EXPR_SHADOW, _expression_inputs(_EXPR_SHADOW, roles)
     ).rename('Shadow_Index')
     print("✓ Shadow index")
     
@@ -207,22 +278,45 @@ def create_custom_calculations(image):
     
     return custom_image
 
-def analyze_image_statistics(image, region=None):
+@functools.lru_cache(maxsize=None)
+def _summary_reducer():
+    """
+    Combined min/max, mean, stdDev and quartile reducer.
+    
+    Returns:
+        ee.Reducer: Reducer producing all summary statistics in one pass
+    """
+    return (ee.Reducer.minMax()
+            .combine(reducer2=ee.Reducer.mean(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.stdDev(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.percentile([25, 75]), sharedInputs=True))
+
+def analyze_image_statistics(image, region=None, scale=30, tile_scale=4,
+                             best_effort=True):
     """
     Calculate comprehensive statistics for image bands.
     
     Args:
         image: Earth Engine image
         region: Optional region for analysis (uses image bounds if None)
+        scale: Scale for analysis
+        tile_scale: Tile scale for the reduction (higher uses smaller tiles
+            and avoids out-of-memory errors on large regions)
+        best_effort: Coarsen the scale instead of failing when the region
+            exceeds maxPixels
     
     Returns:
-        dict: Dictionary containing statistics
+        tuple: (band names, array of shape (n_bands, 6)) with columns
+            mean, stdDev, min, max, p25 and p75 (NaN where unavailable)
     """
     print("\n📈 Statistical Analysis")
     print("-" * 30)
     
     if region is None:
         region = image.geometry()
+    else:
+        # Clip to the requested region so only tiles inside it are read
+        image = image.clip(region)
     
     # Define bands to analyze
     spectral_bands = ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7']
@@ -232,40 +326,33 @@ def analyze_image_statistics(image, region=None):
     
     # Calculate comprehensive statistics
     stats = image.select(all_bands).reduceRegion(
-        reducer=ee.Reducer.minMax().combine(
-            reducer2=ee.Reducer.mean(),
-            sharedInputs=True
-        ).combine(
-            reducer2=ee.Reducer.stdDev(),
-            sharedInputs=True
-        ).combine(
-            reducer2=ee.Reducer.percentile([25, 75]),
-            sharedInputs=True
-        ),
+        reducer=_summary_reducer(),
         geometry=region,
-        scale=30,
-        maxPixels=1e9
+        scale=scale,
+        maxPixels=1e9,
+        tileScale=tile_scale,
+        bestEffort=best_effort
     )
     
     stats_dict = stats.getInfo()
     
+    # Reshape into one (band x statistic) array for vectorized follow-up work
+    stat_names = ('mean', 'stdDev', 'min', 'max', 'p25', 'p75')
+    stats_array = np.array(
+        [[stats_dict.get(f'{band}_{stat}') for stat in stat_names] for band in all_bands],
+        dtype=np.float64
+    )
+    
     # Format and display statistics
     print("Band Statistics Summary:")
     print("-" * 60)
+    print(f"{'Band':<8}" + "".join(f"{stat:>10}" for stat in stat_names))
     
-    for band in all_bands:
-        if f'{band}_mean' in stats_dict:
-            print(f"\n{band}:")
-            print(f"  Mean: {stats_dict[f'{band}_mean']:.4f}")
-            print(f"  StdDev: {stats_dict[f'{band}_stdDev']:.4f}")
-            print(f"  Min: {stats_dict[f'{band}_min']:.4f}")
-            print(f"  Max: {stats_dict[f'{band}_max']:.4f}")
-            
-            if f'{band}_p25' in stats_dict:
-                print(f"  Q1 (25%): {stats_dict[f'{band}_p25']:.4f}")
-                print(f"  Q3 (75%): {stats_dict[f'{band}_p75']:.4f}")
-    
-    return stats_dict
+    for band, row in zip(all_bands, stats_array):
+        if not np.isnan(row).all():
+            print(f"{band:<8}" + "".join(f"{value:>10.4f}" for value in row))
+    
+    return all_bands, stats_array
 
 def demonstrate_conditional_operations(image):
     """
@@ -280,25 +367,35 @@ def demonstrate_conditional_operations(image):
     print("\n🎯 Conditional Operations and Masking")
     print("-" * 40)
     
+    # Evaluate all three thresholds in one expression, packed into the bits
+    # of a single uint8 band: vegetation = 4, water = 2, urban = 1
+    packed_masks = image.expression(
+        '(NDVI > 0.3) * 4 + (NDWI > 0.2) * 2 + (NDBI > 0.1)',
+        {
+            'NDVI': image.select('NDVI'),
+            'NDWI': image.select('NDWI'),
+            'NDBI': image.select('NDBI')
+        }
+    ).toUint8().rename('Masks_Packed')
+    
     # Create vegetation mask (NDVI > 0.3)
-    vegetation_mask = image.select('NDVI').gt(0.3)
+    vegetation_mask = packed_masks.bitwiseAnd(4).neq(0).toUint8()
     print("✓ Vegetation mask created (NDVI > 0.3)")
     
     # Create water mask (NDWI > 0.2)
-    water_mask = image.select('NDWI').gt(0.2)
+    water_mask = packed_masks.bitwiseAnd(2).neq(0).toUint8()
     print("✓ Water mask created (NDWI > 0.2)")
     
     # Create urban mask (NDBI > 0.1)
-    urban_mask = image.select('NDBI').gt(0.1)
+    urban_mask = packed_masks.bitwiseAnd(1).neq(0).toUint8()
     print("✓ Urban mask created (NDBI > 0.1)")
     
-    # Combined land cover classification using conditions
-    land_cover = (ee.Image(0)  # Start with zeros
-                  .where(water_mask, 1)      # Water = 1
-                  .where(vegetation_mask, 2)  # Vegetation = 2
-                  .where(urban_mask, 3))     # Urban = 3
-    
-    land_cover = land_cover.rename('Land_Cover')
+    # Combined land cover classification in one expression, kept as uint8
+    # (Urban = 3 over Vegetation = 2 over Water = 1, otherwise 0)
+    land_cover = image.expression(
+        'u ? 3 : (v ? 2 : (w ? 1 : 0))',
+        {'w': water_mask, 'v': vegetation_mask, 'u': urban_mask}
+    ).toUint8().rename('Land_Cover')
     print("✓ Simple land cover classification")
     
     # Conditional value assignment
@@ -316,12 +413,12 @@ def demonstrate_conditional_operations(image):
             'NDWI': image.select('NDWI'),
             'EVI': image.select('EVI')
         }
-    ).rename('Healthy_Vegetation')
+    ).toUint8().rename('Healthy_Vegetation')
     print("✓ Complex conditional expression")
     
     # Add conditional results
     conditional_image = image.addBands([
-        land_cover, high_vegetation, complex_condition,
+        land_cover, high_vegetation, complex_condition, packed_masks,
         vegetation_mask.rename('Vegetation_Mask'),
         water_mask.rename('Water_Mask'),
         urban_mask.rename('Urban_Mask')
@@ -334,42 +431,9 @@ def create_visualization_parameters():
     Create visualization parameters for different types of data.
     
     Returns:
-        dict: Dictionary of visualization parameters
+        Mapping: Read-only visualization parameters by layer name
     """
-    vis_params = {
-        'true_color': {
-            'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
-            'min': 0.0,
-            'max': 0.3,
-            'gamma': 1.2
-        },
-        'false_color': {
-            'bands': ['SR_B5', 'SR_B4', 'SR_B3'],
-            'min': 0.0,
-            'max': 0.3,
-            'gamma': 1.2
-        },
-        'ndvi': {
-            'bands': ['NDVI'],
-            'min': -0.2,
-            'max': 0.8,
-            'palette': ['blue', 'white', 'green']
-        },
-        'ndwi': {
-            'bands': ['NDWI'],
-            'min': -0.3,
-            'max': 0.5,
-            'palette': ['white', 'blue']
-        },
-        'land_cover': {
-            'bands': ['Land_Cover'],
-            'min': 0,
-            'max': 3,
-            'palette': ['gray', 'blue', 'green', 'red']
-        }
-    }
-    
-    return vis_params
+    return _VIS_PARAMS
 
 def main():
     """
@@ -377,7 +441,7 @@ def main():
     """
     # Initialize Earth Engine
     try:
-        ee.Initialize(project='your-project-id')
+        ee.Initialize(project='your-project-id', opt_url=HIGH_VOLUME_URL)
         print("✓ Earth Engine initialized successfully!")
     except Exception as e:
         print(f"✗ Error initializing Earth Engine: {e}")
@@ -415,12 +479,11 @@ def main():
     print("\n📤 Export Configuration Example")
     print("-" * 35)
     
-    # Select key bands for export
-    export_image = final_image.select([
-        'SR_B4', 'SR_B3', 'SR_B2',  # RGB bands
-        'NDVI', 'NDWI', 'EVI',      # Vegetation indices
-        'Land_Cover'                 # Classification
-    ])
+    # Band schema of the final image, fetched once and reused for the summary
+    all_bands = final_image.bandNames().getInfo()
+    
+    # Select key bands for export by position
+    export_image = final_image.select([all_bands.index(band) for band in _EXPORT_BANDS])
     
     export_config = {
         'image': export_image,
@@ -441,12 +504,17 @@ def main():
     print("\n📋 Summary of Calculations Performed")
     print("-" * 40)
     
-    all_bands = final_image.bandNames().getInfo()
-    
-    spectral_bands = [b for b in all_bands if b.startswith('SR_B')]
-    index_bands = [b for b in all_bands if b in ['NDVI', 'NDWI', 'NDBI', 'EVI', 'SAVI', 'MNDWI', 'NBR']]
-    custom_bands = [b for b in all_bands if 'Custom' in b or 'Visibility' in b or 'Soil' in b or 'Shadow' in b]
-    mask_bands = [b for b in all_bands if 'Mask' in b or 'Cover' in b or 'Vegetation' in b]
+    # Sort bands into categories in a single pass
+    spectral_bands, index_bands, custom_bands, mask_bands = [], [], [], []
+    for b in all_bands:
+        if b.startswith('SR_B'):
+            spectral_bands.append(b)
+        elif b in _INDEX_BAND_ORDER:
+            index_bands.append(b)
+        elif 'Custom' in b or 'Visibility' in b or 'Soil' in b or 'Shadow' in b:
+            custom_bands.append(b)
+        elif 'Mask' in b or 'Cover' in b or 'Vegetation' in b:
+            mask_bands.append(b)
     
     print(f"Original spectral bands ({len(spectral_bands)}): {spectral_bands}")
     print(f"Standard indices ({len(index_bands)}): {index_bands}")
@@ -12,11 +12,13 @@ Use case: Analyzing NDVI trends over agricultural areas
 """
 
 import ee
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from matplotlib.collections import LineCollection
 
-def analyze_ndvi_time_series(geometry, start_date, end_date):
+def analyze_ndvi_time_series(geometry, start_date, end_date, min_pixels=1):
     """
     Analyze NDVI time series for a given geometry and date range.
     
@@ -24,56 +26,48 @@ def analyze_ndvi_time_series(geometry, start_date, end_date):
         geometry: ee.Geometry object defining the area of interest
         start_date: Start date as string ('YYYY-MM-DD')
         end_date: End date as string ('YYYY-MM-DD')
+        min_pixels: Minimum number of valid pixels for an image to be kept
     
     Returns:
         Dictionary containing time series data and statistics
     """
     
     # Load Landsat 8 Surface Reflectance collection
-    collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                 .filterDate(start_date, end_date)
-                 .filterBounds(geometry)
-                 .filter(ee.Filter.lt('CLOUD_COVER', 20)))
-    
-    print(f"Found {collection.size().getInfo()} images in the collection")
+    collection = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2').filter(
+        ee.Filter.And(
+            ee.Filter.date(start_date, end_date),
+            ee.Filter.bounds(geometry),
+            ee.Filter.lt('CLOUD_COVER', 20)
+        )
+    )
     
     # Function to calculate NDVI and add time properties
     def add_ndvi_and_time(image):
         # Calculate NDVI
         ndvi = image.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
         
-        # Add time properties
-        date = ee.Date(image.get('system:time_start'))
-        years = date.difference(ee.Date('1970-01-01'), 'year')
-        
-        return (image.addBands(ndvi)
-                    .set('date', date)
-                    .set('year', date.get('year'))
-                    .set('month', date.get('month'))
-                    .set('day_of_year', date.getRelative('day', 'year'))
-                    .set('decimal_year', years))
+        # Only the timestamp is sent back; date fields are derived client-side
+        return image.addBands(ndvi).set('ts', image.get('system:time_start'))
     
     # Apply NDVI calculation to collection
     ndvi_collection = collection.map(add_ndvi_and_time)
     
     # Create time series by reducing each image to mean NDVI
     def extract_ndvi_value(image):
-        # Calculate mean NDVI over the geometry
-        ndvi_mean = image.select('NDVI').reduceRegion(
-            reducer=ee.Reducer.mean(),
+        # Calculate mean NDVI and valid pixel count over the geometry in one pass
+        ndvi_stats = image.select('NDVI').reduceRegion(
+            reducer=ee.Reducer.mean().combine(ee.Reducer.count(), sharedInputs=True),
             geometry=geometry,
             scale=30,
-            maxPixels=1e9
+            maxPixels=1e9,
+            tileScale=4
         )
         
-        # Return feature with date and NDVI value
+        # Return feature with date, NDVI value and pixel count
         return ee.Feature(None, {
-            'date': image.get('date'),
-            'decimal_year': image.get('decimal_year'),
-            'ndvi': ndvi_mean.get('NDVI'),
-            'year': image.get('year'),
-            'month': image.get('month'),
-            'day_of_year': image.get('day_of_year')
+            'ts': image.get('ts'),
+            'ndvi': ndvi_stats.get('NDVI_mean'),
+            'ndvi_count': ndvi_stats.get('NDVI_count')
         })
     
     # Extract time series data
@@ -81,22 +75,23 @@ def analyze_ndvi_time_series(geometry, start_date, end_date):
     
     # Convert to pandas DataFrame for analysis
     time_series_list = time_series.getInfo()['features']
-    df_data = []
-    
-    for feature in time_series_list:
-        props = feature['properties']
-        if props['ndvi'] is not None:  # Filter out null values
-            df_data.append({
-                'date': datetime.fromtimestamp(props['date']['value'] / 1000),
-                'decimal_year': props['decimal_year'],
-                'ndvi': props['ndvi'],
-                'year': props['year'],
-                'month': props['month'],
-                'day_of_year': props['day_of_year']
-            })
-    
-    df = pd.DataFrame(df_data)
-    df = df.sort_values('date')
+    df = pd.json_normalize([feature['properties'] for feature in time_series_list])
+    
+    df = df.reindex(columns=['ts', 'ndvi', 'ndvi_count'])
+    df = df.dropna(subset=['ndvi'])  # Filter out null values
+    df = df[df.pop('ndvi_count') >= min_pixels]  # Drop sparsely covered images
+    
+    # Derive the date fields from the millisecond timestamps
+    df['date'] = pd.to_datetime(df.pop('ts'), unit='ms')
+    df['decimal_year'] = (df['date'] - pd.Timestamp('1970-01-01')) / pd.Timedelta(days=365.25)
+    df['year'] = df['date'].dt.year
+    df['month'] = df['date'].dt.month
+    df['day_of_year'] = df['date'].dt.dayofyear - 1  # Days since January 1
+    df = df[['date', 'decimal_year', 'ndvi', 'year', 'month', 'day_of_year']]
+    
+    # Sort on the int64 nanosecond view of the dates
+    order = np.argsort(df['date'].to_numpy().view('i8'), kind='quicksort')
+    df = df.iloc[order].reset_index(drop=True)
     
     # Calculate statistics
     stats = {
@@ -109,14 +104,86 @@ def analyze_ndvi_time_series(geometry, start_date, end_date):
     
     return df, stats
 
-def plot_time_series(df, stats, title="NDVI Time Series"):
+def minmax_downsample(y, n_out):
+    """
+    Select indices that keep the minimum and maximum of each of n_out // 2 bins.
+    
+    Args:
+        y: 1-D array of values in plotting order
+        n_out: Approximate number of points to keep
+    
+    Returns:
+        numpy.ndarray: Sorted indices of the points to plot
+    """
+    n = len(y)
+    n_bins = max(n_out // 2, 1)
+    if n <= n_out:
+        return np.arange(n)
+    
+    # Sort by bin, then by value: each bin's first entry is its min, last its max
+    edges = np.linspace(0, n, n_bins + 1).astype(np.int64)
+    bin_ids = np.repeat(np.arange(n_bins), np.diff(edges))
+    order = np.lexsort((y, bin_ids))
+    keep = np.concatenate([order[edges[:-1]], order[edges[1:] - 1], [0, n - 1]])
+    return np.unique(keep)
+
+def monthly_ndvi_stats(df):
+    """
+    Compute mean, standard deviation and count of NDVI per calendar month.
+    
+    Args:
+        df: Time series DataFrame with 'date' and 'ndvi' columns
+    
+    Returns:
+        pandas.DataFrame: 'mean', 'std' and 'count' columns indexed by month
+    """
+    month = df['date'].dt.month.to_numpy()
+    values = df['ndvi'].to_numpy(dtype=np.float64)
+    
+    # One bincount pass per accumulator over the fixed 1-12 month keys
+    counts = np.bincount(month, minlength=13)
+    sums = np.bincount(month, weights=values, minlength=13)
+    squares = np.bincount(month, weights=values * values, minlength=13)
+    
+    present = counts > 0
+    n = counts[present]
+    mean = sums[present] / n
+    
+    # Sample standard deviation (ddof=1), undefined for single observations
+    sum_sq_dev = np.maximum(squares[present] - n * mean * mean, 0)
+    variance = np.divide(sum_sq_dev, n - 1, out=np.full(n.shape, np.nan), where=n > 1)
+    
+    return pd.DataFrame(
+        {'mean': mean, 'std': np.sqrt(variance), 'count': n},
+        index=pd.Index(np.flatnonzero(present), name='date')
+    )
+
+def plot_time_series(df, stats, title="NDVI Time Series", seasonal_stats=None,
+                     max_points=1000):
     """
     Create time series plot with trend analysis.
+    
+    Args:
+        df: Time series DataFrame with 'date' and 'ndvi' columns
+        stats: Summary statistics from analyze_ndvi_time_series
+        title: Plot title
+        seasonal_stats: Precomputed monthly_ndvi_stats(df), computed if omitted
+        max_points: Series longer than twice this are min/max downsampled to it
     """
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
     
-    # Main time series plot
-    ax1.plot(df['date'], df['ndvi'], 'o-', linewidth=1, markersize=3, alpha=0.7)
+    # Main time series plot, drawn as a single collection of line segments
+    x = mdates.date2num(df['date'])
+    y = df['ndvi'].to_numpy()
+    if len(y) > 2 * max_points:
+        keep = minmax_downsample(y, max_points)
+        x, y = x[keep], y[keep]
+    points = np.column_stack([x, y])
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    ax1.add_collection(LineCollection(segments, linewidths=1, alpha=0.7))
+    ax1.scatter(x, y, s=9, alpha=0.7)
+    ax1.xaxis_date()
+    ax1.autoscale_view()
     ax1.set_title(f"{title}\nMean: {stats['mean_ndvi']:.3f} ± {stats['std_ndvi']:.3f}")
     ax1.set_xlabel('Date')
     ax1.set_ylabel('NDVI')
@@ -125,7 +192,9 @@ def plot_time_series(df, stats, title="NDVI Time Series"):
     ax1.legend()
     
     # Monthly aggregation
-    monthly_mean = df.groupby(df['date'].dt.month)['ndvi'].mean()
+    if seasonal_stats is None:
+        seasonal_stats = monthly_ndvi_stats(df)
+    monthly_mean = seasonal_stats['mean']
     ax2.bar(monthly_mean.index, monthly_mean.values, alpha=0.7, color='green')
     ax2.set_title('Monthly Average NDVI')
     ax2.set_xlabel('Month')
@@ -170,12 +239,14 @@ def main():
     print(f"Standard deviation: {stats['std_ndvi']:.3f}")
     print(f"Range: {stats['min_ndvi']:.3f} to {stats['max_ndvi']:.3f}")
     
+    # Monthly statistics shared by the plot and the seasonal analysis
+    seasonal_stats = monthly_ndvi_stats(df)
+    
     # Create visualization
-    plot_time_series(df, stats, "Agricultural Area NDVI Time Series")
+    plot_time_series(df, stats, "Agricultural Area NDVI Time Series", seasonal_stats)
     
     # Seasonal analysis
     print("\n🌱 Seasonal Analysis:")
-    seasonal_stats = df.groupby(df['date'].dt.month)['ndvi'].agg(['mean', 'std', 'count'])
     print(seasonal_stats)
     
     print("\n✅ Time series analysis completed successfully!")
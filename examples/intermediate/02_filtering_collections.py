@@ -16,10 +16,31 @@ Prerequisites:
 """
 
 import ee
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
+# Day-of-year ranges for each season
+SEASON_RANGES = {
+    'spring': [80, 171],   # March 21 - June 20
+    'summer': [172, 264],  # June 21 - September 21
+    'fall': [265, 354],    # September 22 - December 20
+    'winter': [355, 79]    # December 21 - March 20
+}
+
+def _day_of_year_filter(start, end):
+    """Build a DAY_OF_YEAR range filter, wrapping around the year boundary."""
+    if start > end:
+        return ee.Filter.Or(
+            ee.Filter.gte('DAY_OF_YEAR', start),
+            ee.Filter.lte('DAY_OF_YEAR', end)
+        )
+    return ee.Filter.And(
+        ee.Filter.gte('DAY_OF_YEAR', start),
+        ee.Filter.lte('DAY_OF_YEAR', end)
+    )
+
 class ImageCollectionFilter:
     """Class for advanced image collection filtering operations."""
     
@@ -48,27 +69,38 @@ class ImageCollectionFilter:
         
         # Filter by date range
         date_filtered = collection.filterDate('2023-01-01', '2023-12-31')
-        print(f"   Original collection size: {collection.size().getInfo()}")
-        print(f"   After date filter: {date_filtered.size().getInfo()}")
         
         # Filter by specific months
         summer_images = collection.filter(
             ee.Filter.calendarRange(6, 8, 'month')
         )
-        print(f"   Summer months only: {summer_images.size().getInfo()}")
         
         # Spatial filtering
-        print("\n2. Spatial Filtering:")
         point = ee.Geometry.Point([-122.4, 37.8])
         region = ee.Geometry.Rectangle([-123, 37, -122, 38])
         
         # Filter by point intersection
         point_filtered = date_filtered.filterBounds(point)
-        print(f"   Images containing point: {point_filtered.size().getInfo()}")
         
         # Filter by region intersection
         region_filtered = date_filtered.filterBounds(region)
-        print(f"   Images intersecting region: {region_filtered.size().getInfo()}")
+        
+        # Fetch all collection sizes in one request
+        sizes = ee.Dictionary({
+            'original': collection.size(),
+            'date': date_filtered.size(),
+            'summer': summer_images.size(),
+            'point': point_filtered.size(),
+            'region': region_filtered.size()
+        }).getInfo()
+        
+        print(f"   Original collection size: {sizes['original']}")
+        print(f"   After date filter: {sizes['date']}")
+        print(f"   Summer months only: {sizes['summer']}")
+        
+        print("\n2. Spatial Filtering:")
+        print(f"   Images containing point: {sizes['point']}")
+        print(f"   Images intersecting region: {sizes['region']}")
         
         return region_filtered
     
@@ -86,33 +118,41 @@ class ImageCollectionFilter:
                 ee.Filter.lt('CLOUD_COVER', 30)
             )
         )
-        print(f"   Low cloud cover (<10%): {low_cloud.size().getInfo()}")
-        print(f"   Medium cloud cover (10-30%): {medium_cloud.size().getInfo()}")
         
         # Sun elevation filtering
-        print("\n2. Sun Elevation Filtering:")
         high_sun = collection.filter(ee.Filter.gt('SUN_ELEVATION', 45))
-        print(f"   High sun elevation (>45°): {high_sun.size().getInfo()}")
         
         # Acquisition DOY filtering
-        print("\n3. Day of Year Filtering:")
-        growing_season = collection.filter(
-            ee.Filter.And(
-                ee.Filter.gte('DAY_OF_YEAR', 120),  # May
-                ee.Filter.lte('DAY_OF_YEAR', 243)   # August
-            )
-        )
-        print(f"   Growing season images: {growing_season.size().getInfo()}")
+        growing_season = collection.filter(_day_of_year_filter(120, 243))  # May - August
         
         # Satellite path/row filtering
-        print("\n4. Path/Row Filtering:")
         specific_tile = collection.filter(
             ee.Filter.And(
                 ee.Filter.eq('WRS_PATH', 44),
                 ee.Filter.eq('WRS_ROW', 34)
             )
         )
-        print(f"   Specific Landsat tile: {specific_tile.size().getInfo()}")
+        
+        # Fetch all collection sizes in one request
+        sizes = ee.Dictionary({
+            'low': low_cloud.size(),
+            'medium': medium_cloud.size(),
+            'high_sun': high_sun.size(),
+            'growing': growing_season.size(),
+            'tile': specific_tile.size()
+        }).getInfo()
+        
+        print(f"   Low cloud cover (<10%): {sizes['low']}")
+        print(f"   Medium cloud cover (10-30%): {sizes['medium']}")
+        
+        print("\n2. Sun Elevation Filtering:")
+        print(f"   High sun elevation (>45°): {sizes['high_sun']}")
+        
+        print("\n3. Day of Year Filtering:")
+        print(f"   Growing season images: {sizes['growing']}")
+        
+        print("\n4. Path/Row Filtering:")
+        print(f"   Specific Landsat tile: {sizes['tile']}")
         
         return low_cloud
     
@@ -126,18 +166,18 @@ class ImageCollectionFilter:
             """Custom function to filter based on multiple quality criteria."""
             qa = image.select('QA_PIXEL')
             
-            # Check for clear conditions
-            clear_conditions = (
-                qa.bitwiseAnd(1 << 3).eq(0).And(  # No cloud shadow
-                qa.bitwiseAnd(1 << 4).eq(0).And(  # No cloud
-                qa.bitwiseAnd(1 << 5).eq(0)))     # No cirrus
+            # Check for clear conditions (no cloud shadow, cloud or cirrus)
+            # with a single combined bit mask
+            clear_conditions = qa.bitwiseAnd((1 << 3) | (1 << 4) | (1 << 5)).eq(0)
             
-            # Calculate percentage of clear pixels
+            # Calculate percentage of clear pixels from a coarse pyramid level
             clear_percentage = clear_conditions.reduceRegion(
                 reducer=ee.Reducer.mean(),
                 geometry=image.geometry(),
-                scale=1000,
-                maxPixels=1e6
+                scale=2000,
+                maxPixels=1e7,
+                bestEffort=True,
+                tileScale=4
             ).values().get(0)
             
             # Return image with clear percentage property
@@ -151,10 +191,8 @@ class ImageCollectionFilter:
         high_quality = quality_assessed.filter(
             ee.Filter.gt('CLEAR_PERCENTAGE', 0.8)
         )
-        print(f"   High quality images (>80% clear): {high_quality.size().getInfo()}")
         
         # Temporal proximity filtering
-        print("\n2. Temporal Proximity Filtering:")
         target_date = ee.Date('2023-07-15')
         
         # Filter images within 30 days of target date
@@ -164,36 +202,40 @@ class ImageCollectionFilter:
                 ee.Filter.lte('system:time_start', target_date.advance(30, 'day').millis())
             )
         )
-        print(f"   Images within 30 days of July 15: {temporal_proximity.size().getInfo()}")
         
         # Seasonal filtering
+        spring_images = collection.filter(_day_of_year_filter(*SEASON_RANGES['spring']))
+        summer_images = collection.filter(_day_of_year_filter(*SEASON_RANGES['summer']))
+        
+        # Fetch all collection sizes in one request
+        sizes = ee.Dictionary({
+            'high_quality': high_quality.size(),
+            'proximity': temporal_proximity.size(),
+            'spring': spring_images.size(),
+            'summer': summer_images.size(),
+            'high_quality_ids': high_quality.aggregate_array('system:index'),
+            'clear_percentages': high_quality.aggregate_array('CLEAR_PERCENTAGE')
+        }).getInfo()
+        
+        # Materialize the quality assessment: later steps reload the selected
+        # scenes by ID instead of re-running quality_filter on the backend
+        clear_by_id = ee.Dictionary.fromLists(
+            sizes['high_quality_ids'], sizes['clear_percentages']
+        )
+        high_quality = (collection
+                        .filter(ee.Filter.inList('system:index', sizes['high_quality_ids']))
+                        .map(lambda image: image.set(
+                            'CLEAR_PERCENTAGE', clear_by_id.get(image.get('system:index'))
+                        )))
+        
+        print(f"   High quality images (>80% clear): {sizes['high_quality']}")
+        
+        print("\n2. Temporal Proximity Filtering:")
+        print(f"   Images within 30 days of July 15: {sizes['proximity']}")
+        
         print("\n3. Seasonal Filtering:")
-        def get_season_filter(season):
-            """Get filter for specific season."""
-            season_ranges = {
-                'spring': [80, 171],   # March 21 - June 20
-                'summer': [172, 264],  # June 21 - September 21
-                'fall': [265, 354],    # September 22 - December 20
-                'winter': [355, 79]    # December 21 - March 20
-            }
-            
-            if season == 'winter':
-                # Handle year boundary for winter
-                return ee.Filter.Or(
-                    ee.Filter.gte('DAY_OF_YEAR', 355),
-                    ee.Filter.lte('DAY_OF_YEAR', 79)
-                )
-            else:
-                start, end = season_ranges[season]
-                return ee.Filter.And(
-                    ee.Filter.gte('DAY_OF_YEAR', start),
-                    ee.Filter.lte('DAY_OF_YEAR', end)
-                )
-        
-        spring_images = collection.filter(get_season_filter('spring'))
-        summer_images = collection.filter(get_season_filter('summer'))
-        print(f"   Spring images: {spring_images.size().getInfo()}")
-        print(f"   Summer images: {summer_images.size().getInfo()}")
+        print(f"   Spring images: {sizes['spring']}")
+        print(f"   Summer images: {sizes['summer']}")
         
         return high_quality
     
@@ -207,35 +249,47 @@ class ImageCollectionFilter:
         start_date = '2023-01-01'
         end_date = '2023-12-31'
         
+        # Combine the bounds, date and cloud criteria into one filter per sensor
+        bounds_filter = ee.Filter.bounds(region)
+        date_filter = ee.Filter.date(start_date, end_date)
+        landsat_filter = ee.Filter.And(
+            bounds_filter, date_filter, ee.Filter.lt('CLOUD_COVER', 20)
+        )
+        
         # Landsat 8
-        landsat8 = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                   .filterBounds(region)
-                   .filterDate(start_date, end_date)
-                   .filter(ee.Filter.lt('CLOUD_COVER', 20)))
+        landsat8 = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2').filter(landsat_filter)
         
         # Landsat 9
-        landsat9 = (ee.ImageCollection('LANDSAT/LC09/C02/T1_L2')
-                   .filterBounds(region)
-                   .filterDate(start_date, end_date)
-                   .filter(ee.Filter.lt('CLOUD_COVER', 20)))
+        landsat9 = ee.ImageCollection('LANDSAT/LC09/C02/T1_L2').filter(landsat_filter)
         
         # Sentinel-2
-        sentinel2 = (ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-                    .filterBounds(region)
-                    .filterDate(start_date, end_date)
-                    .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)))
-        
-        print(f"Landsat 8 images: {landsat8.size().getInfo()}")
-        print(f"Landsat 9 images: {landsat9.size().getInfo()}")
-        print(f"Sentinel-2 images: {sentinel2.size().getInfo()}")
+        sentinel2 = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED').filter(
+            ee.Filter.And(
+                bounds_filter, date_filter,
+                ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)
+            )
+        )
         
         # Merge collections
         merged_landsat = landsat8.merge(landsat9)
-        print(f"Merged Landsat: {merged_landsat.size().getInfo()}")
         
         # Filter merged collection
         best_landsat = merged_landsat.filter(ee.Filter.lt('CLOUD_COVER', 10))
-        print(f"Best Landsat images (<10% cloud): {best_landsat.size().getInfo()}")
+        
+        # Fetch all collection sizes in one request
+        sizes = ee.Dictionary({
+            'landsat8': landsat8.size(),
+            'landsat9': landsat9.size(),
+            'sentinel2': sentinel2.size(),
+            'merged': merged_landsat.size(),
+            'best': best_landsat.size()
+        }).getInfo()
+        
+        print(f"Landsat 8 images: {sizes['landsat8']}")
+        print(f"Landsat 9 images: {sizes['landsat9']}")
+        print(f"Sentinel-2 images: {sizes['sentinel2']}")
+        print(f"Merged Landsat: {sizes['merged']}")
+        print(f"Best Landsat images (<10% cloud): {sizes['best']}")
         
         return {
             'landsat8': landsat8,
@@ -249,54 +303,56 @@ class ImageCollectionFilter:
         print("\n⏰ Temporal Filtering Strategies")
         print("-" * 40)
         
+        months = [1, 4, 7, 10]  # Jan, Apr, Jul, Oct
+        years = [2020, 2021, 2022, 2023]
+        start_date = ee.Date('2023-01-01')
+        
+        # Day offsets of the 16-day periods (show first 10 periods)
+        period_offsets = list(range(0, 365, 16))[:10]
+        
+        def count_16day_period(offset):
+            """Count images in the 16-day period starting at a day offset."""
+            period_start = start_date.advance(offset, 'day')
+            period_end = period_start.advance(16, 'day')
+            return collection.filterDate(period_start, period_end).size()
+        
+        # Build every count server-side and fetch them in one request
+        counts = {}
+        for month in months:
+            monthly = collection.filter(ee.Filter.calendarRange(month, month, 'month'))
+            counts[f'month_{month}'] = monthly.size()
+        for year in years:
+            annual = collection.filter(ee.Filter.calendarRange(year, year, 'year'))
+            counts[f'year_{year}'] = annual.size()
+        counts['periods'] = ee.List(period_offsets).map(count_16day_period)
+        counts = ee.Dictionary(counts).getInfo()
+        
         # Monthly composites
         print("1. Monthly Filtering:")
-        months = [1, 4, 7, 10]  # Jan, Apr, Jul, Oct
         monthly_counts = {}
         
         for month in months:
-            monthly = collection.filter(ee.Filter.calendarRange(month, month, 'month'))
-            count = monthly.size().getInfo()
+            count = counts[f'month_{month}']
             monthly_counts[month] = count
             month_name = datetime(2023, month, 1).strftime('%B')
             print(f"   {month_name}: {count} images")
         
         # Annual time series
         print("\n2. Annual Time Series:")
-        years = [2020, 2021, 2022, 2023]
         annual_counts = {}
         
         for year in years:
-            annual = collection.filter(ee.Filter.calendarRange(year, year, 'year'))
-            count = annual.size().getInfo()
+            count = counts[f'year_{year}']
             annual_counts[year] = count
             print(f"   {year}: {count} images")
         
         # Regular interval filtering
         print("\n3. Regular Interval Filtering (16-day):")
-        start_date = ee.Date('2023-01-01')
-        
-        def create_16day_periods():
-            """Create 16-day period filters."""
-            periods = []
-            for i in range(0, 365, 16):
-                period_start = start_date.advance(i, 'day')
-                period_end = period_start.advance(16, 'day')
-                periods.append({
-                    'start': period_start,
-                    'end': period_end,
-                    'day': i + 1
-                })
-            return periods
-        
-        periods = create_16day_periods()
         period_counts = []
         
-        for i, period in enumerate(periods[:10]):  # Show first 10 periods
-            period_images = collection.filterDate(period['start'], period['end'])
-            count = period_images.size().getInfo()
+        for i, (offset, count) in enumerate(zip(period_offsets, counts['periods'])):
             period_counts.append(count)
-            print(f"   Period {i+1} (Day {period['day']}): {count} images")
+            print(f"   Period {i+1} (Day {offset + 1}): {count} images")
         
         return {
             'monthly': monthly_counts,
@@ -332,15 +388,17 @@ class ImageCollectionFilter:
         # Advanced reductions
         print("\n2. Advanced Reduction Methods:")
         
-        # Quality mosaic (best pixel based on cloud score)
-        def add_cloud_score(image):
-            """Add cloud score to image."""
-            cloud_score = ee.Algorithms.Landsat.simpleCloudScore(image)
-            return image.addBands(cloud_score.select('cloud'))
+        # Quality mosaic (prefers clear pixels)
+        def add_clear_flag(image):
+            """Add a QA_PIXEL based clear flag (no cloud shadow, cloud or cirrus)."""
+            qa = image.select('QA_PIXEL')
+            clear = qa.bitwiseAnd((1 << 3) | (1 << 4) | (1 << 5)).eq(0)
+            return image.addBands(clear.toUint8().rename('clear'))
         
-        scored_collection = collection.map(add_cloud_score)
-        quality_mosaic = scored_collection.qualityMosaic('cloud')
-        print("   ✓ Quality mosaic created (lowest cloud score)")
+        # qualityMosaic keeps the highest value, so mosaic on the clear flag
+        flagged_collection = collection.map(add_clear_flag)
+        quality_mosaic = flagged_collection.qualityMosaic('clear')
+        print("   ✓ Quality mosaic created (clear pixels preferred)")
         
         # Temporal percentiles
         percentile_composite = collection.reduce(
@@ -368,61 +426,98 @@ class ImageCollectionFilter:
             'custom': custom_composite
         }
     
-    def analyze_collection_temporal_distribution(self, collection):
-        """Analyze temporal distribution of image collection."""
+    def analyze_collection_temporal_distribution(self, collection, include_rows=False):
+        """
+        Analyze temporal distribution of image collection.
+        
+        Args:
+            collection: Image collection to analyze
+            include_rows: Also fetch one row per image as a DataFrame
+        
+        Returns:
+            dict: Image count, date range, mean cloud cover and monthly/yearly
+                histograms, plus a 'rows' DataFrame when include_rows is True
+        """
         print("\n📅 Temporal Distribution Analysis")
         print("-" * 40)
         
         # Get image dates
         def get_image_date(image):
             """Extract date from image."""
+            date = image.date()
             return ee.Feature(None, {
-                'date': image.date(),
+                'date': date,
                 'timestamp': image.get('system:time_start'),
+                'year': date.get('year'),
+                'month': date.get('month'),
                 'cloud_cover': image.get('CLOUD_COVER')
             })
         
-        # Extract dates
+        # Aggregate dates server-side so only the summary is transferred
         dates_collection = collection.map(get_image_date)
-        dates_list = dates_collection.getInfo()['features']
-        
-        # Process dates
-        dates_data = []
-        for feature in dates_list:
-            props = feature['properties']
-            timestamp = props['timestamp']
-            date = datetime.fromtimestamp(timestamp / 1000)
-            
-            dates_data.append({
-                'date': date,
-                'year': date.year,
-                'month': date.month,
-                'day_of_year': date.timetuple().tm_yday,
-                'cloud_cover': props.get('cloud_cover', 0)
-            })
-        
-        df = pd.DataFrame(dates_data)
+        summary = ee.Dictionary({
+            'count': dates_collection.size(),
+            'first': dates_collection.aggregate_min('timestamp'),
+            'last': dates_collection.aggregate_max('timestamp'),
+            'cloud_cover_mean': dates_collection.aggregate_mean('cloud_cover'),
+            'monthly': dates_collection.aggregate_histogram('month'),
+            'yearly': dates_collection.aggregate_histogram('year')
+        }).getInfo()
+        
+        # Histogram keys come back as strings
+        monthly_dist = {int(month): count for month, count in summary['monthly'].items()}
+        yearly_dist = {int(year): count for year, count in summary['yearly'].items()}
         
         # Temporal statistics
-        print(f"Total images: {len(df)}")
-        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-        print(f"Average cloud cover: {df['cloud_cover'].mean():.1f}%")
+        print(f"Total images: {summary['count']}")
+        if summary['count']:
+            first_date = pd.to_datetime(summary['first'], unit='ms')
+            last_date = pd.to_datetime(summary['last'], unit='ms')
+            print(f"Date range: {first_date} to {last_date}")
+        if summary['cloud_cover_mean'] is not None:
+            print(f"Average cloud cover: {summary['cloud_cover_mean']:.1f}%")
         
         # Monthly distribution
-        monthly_dist = df.groupby('month').size()
         print(f"\nMonthly distribution:")
-        for month, count in monthly_dist.items():
+        for month in sorted(monthly_dist):
             month_name = datetime(2023, month, 1).strftime('%B')
-            print(f"   {month_name}: {count} images")
+            print(f"   {month_name}: {monthly_dist[month]} images")
         
         # Yearly distribution
-        if len(df['year'].unique()) > 1:
-            yearly_dist = df.groupby('year').size()
+        if len(yearly_dist) > 1:
             print(f"\nYearly distribution:")
-            for year, count in yearly_dist.items():
-                print(f"   {year}: {count} images")
+            for year in sorted(yearly_dist):
+                print(f"   {year}: {yearly_dist[year]} images")
+        
+        result = {
+            'count': summary['count'],
+            'cloud_cover_mean': summary['cloud_cover_mean'],
+            'monthly': monthly_dist,
+            'yearly': yearly_dist
+        }
+        
+        # Per-image rows are only transferred when explicitly requested
+        if include_rows:
+            dates_list = dates_collection.getInfo()['features']
+            
+            # Fill typed arrays directly so no column needs dtype inference
+            n = len(dates_list)
+            timestamps = np.empty(n, dtype=np.int64)
+            cloud_cover = np.empty(n, dtype=np.float32)
+            for i, feature in enumerate(dates_list):
+                props = feature['properties']
+                timestamps[i] = props['timestamp']
+                cloud_cover[i] = props.get('cloud_cover') or 0
+            
+            df = pd.DataFrame({'date': pd.to_datetime(timestamps, unit='ms')})
+            df['year'] = df['date'].dt.year
+            df['month'] = df['date'].dt.month
+            df['day_of_year'] = df['date'].dt.dayofyear
+            df['cloud_cover'] = cloud_cover
+            
+            result['rows'] = df
         
-        return df
+        return result
 
 def main():
     """Main function demonstrating image collection filtering."""
@@ -453,7 +548,7 @@ def main():
     composites = filter_system.collection_reduction_methods(advanced_filtered)
     
     # Step 7: Temporal distribution analysis
-    temporal_df = filter_system.analyze_collection_temporal_distribution(advanced_filtered)
+    temporal_summary = filter_system.analyze_collection_temporal_distribution(advanced_filtered)
     
     # Summary
     print("\n" + "="*60)
@@ -469,9 +564,10 @@ def main():
     print("• Collection reduction and compositing")
     
     print("\n📈 Collection Statistics:")
-    print(f"• Final filtered collection: {advanced_filtered.size().getInfo()} images")
-    print(f"• Temporal range: {len(temporal_df)} images analyzed")
-    print(f"• Average cloud cover: {temporal_df['cloud_cover'].mean():.1f}%")
+    print(f"• Final filtered collection: {temporal_summary['count']} images")
+    print(f"• Temporal range: {temporal_summary['count']} images analyzed")
+    if temporal_summary['cloud_cover_mean'] is not None:
+        print(f"• Average cloud cover: {temporal_summary['cloud_cover_mean']:.1f}%")
     
     print("\n🏆 Best Practices Applied:")
     print("• Combine multiple filtering criteria")
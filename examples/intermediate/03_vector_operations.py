@@ -16,16 +16,63 @@ Prerequisites:
 - Familiarity with Earth Engine data structures
 """
 
+import functools
+
 import ee
 import json
 import pandas as pd
 
+@functools.lru_cache(maxsize=None)
+def _fc(asset_id):
+    """Return a shared ee.FeatureCollection handle for a catalog asset."""
+    return ee.FeatureCollection(asset_id)
+
+@functools.lru_cache(maxsize=None)
+def _asset_sizes(asset_ids):
+    """Fetch the feature counts of a tuple of assets in one request, once per process."""
+    return ee.Dictionary({asset_id: _fc(asset_id).size() for asset_id in asset_ids}).getInfo()
+
+@functools.lru_cache(maxsize=None)
+def _zonal_reducer():
+    """
+    Combined mean, stdDev, minMax, quartile and sum reducer.
+    
+    Returns:
+        ee.Reducer: Reducer producing all zonal statistics in one pass
+    """
+    return (ee.Reducer.mean()
+            .combine(reducer2=ee.Reducer.stdDev(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.minMax(), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.percentile([25, 75]), sharedInputs=True)
+            .combine(reducer2=ee.Reducer.sum(), sharedInputs=True))
+
+def to_df(fc, props):
+    """
+    Pull selected feature properties into a pandas DataFrame.
+    
+    Uses ee.data.computeFeatures, which pages through the rows and, with the
+    geometry dropped via retainGeometry=False, transfers only the attribute table.
+    
+    Args:
+        fc: ee.FeatureCollection to read
+        props: List of property names to keep
+    
+    Returns:
+        pandas.DataFrame: One row per feature, one column per property
+    """
+    return ee.data.computeFeatures({
+        'expression': fc.select(props, retainGeometry=False),
+        'fileFormat': 'PANDAS_DATAFRAME'
+    })
+
 class VectorOperations:
     """Class for Earth Engine vector operations and spatial analysis."""
     
     def __init__(self, project_id):
         """Initialize with Earth Engine project."""
         self.project_id = project_id
+        self._cache = {}
+        self._ca_union = None
         self.initialize_ee()
     
     def initialize_ee(self):
@@ -37,35 +84,49 @@ class VectorOperations:
             print(f"✗ Error initializing Earth Engine: {e}")
             raise
     
+    def _info(self, obj, key):
+        """Fetch a server-side value once and reuse it for the same key."""
+        if key not in self._cache:
+            self._cache[key] = obj.getInfo()
+        return self._cache[key]
+    
+    def _prefetch(self, values):
+        """Fetch the uncached entries of a {key: server value} dict in one request."""
+        missing = {key: value for key, value in values.items() if key not in self._cache}
+        if missing:
+            self._cache.update(ee.Dictionary(missing).getInfo())
+    
+    def _size(self, fc, key):
+        """Return the memoized size of a feature collection."""
+        return self._info(fc.size(), f'size:{key}')
+    
     def load_vector_datasets(self):
         """Load various vector datasets from Earth Engine catalog."""
         print("🗺️  Loading Vector Datasets")
         print("-" * 35)
         
-        # Administrative boundaries
-        countries = ee.FeatureCollection('USDOS/LSIB_SIMPLE/2017')
-        us_states = ee.FeatureCollection('TIGER/2018/States')
-        us_counties = ee.FeatureCollection('TIGER/2018/Counties')
-        
-        print(f"✓ Countries loaded: {countries.size().getInfo()} features")
-        print(f"✓ US States loaded: {us_states.size().getInfo()} features")
-        print(f"✓ US Counties loaded: {us_counties.size().getInfo()} features")
+        asset_ids = {
+            # Administrative boundaries
+            'countries': 'USDOS/LSIB_SIMPLE/2017',
+            'states': 'TIGER/2018/States',
+            'counties': 'TIGER/2018/Counties',
+            # Protected areas
+            'protected_areas': 'WCMC/WDPA/current/polygons',
+            # Ecoregions
+            'ecoregions': 'RESOLVE/ECOREGIONS/2017'
+        }
         
-        # Protected areas
-        protected_areas = ee.FeatureCollection('WCMC/WDPA/current/polygons')
-        print(f"✓ Protected areas loaded: {protected_areas.size().getInfo()} features")
+        # Handles and feature counts are cached for the whole process
+        datasets = {name: _fc(asset_id) for name, asset_id in asset_ids.items()}
+        sizes = _asset_sizes(tuple(asset_ids.values()))
         
-        # Ecoregions
-        ecoregions = ee.FeatureCollection('RESOLVE/ECOREGIONS/2017')
-        print(f"✓ Ecoregions loaded: {ecoregions.size().getInfo()} features")
+        print(f"✓ Countries loaded: {sizes[asset_ids['countries']]} features")
+        print(f"✓ US States loaded: {sizes[asset_ids['states']]} features")
+        print(f"✓ US Counties loaded: {sizes[asset_ids['counties']]} features")
+        print(f"✓ Protected areas loaded: {sizes[asset_ids['protected_areas']]} features")
+        print(f"✓ Ecoregions loaded: {sizes[asset_ids['ecoregions']]} features")
         
-        return {
-            'countries': countries,
-            'states': us_states,
-            'counties': us_counties,
-            'protected_areas': protected_areas,
-            'ecoregions': ecoregions
-        }
+        return datasets
     
     def basic_feature_operations(self, datasets):
         """Demonstrate basic feature operations."""
@@ -73,47 +134,71 @@ class VectorOperations:
         print("-" * 35)
         
         # Filter features by attribute
-        print("1. Attribute Filtering:")
         california = datasets['states'].filter(ee.Filter.eq('NAME', 'California'))
-        print(f"   California feature: {california.size().getInfo()} feature(s)")
+        
+        # California boundary, computed once and reused by later steps
+        ca_geom = ee.Feature(california.first()).geometry()
         
         # Filter by multiple attributes
         western_states = datasets['states'].filter(
             ee.Filter.inList('NAME', ['California', 'Oregon', 'Washington'])
         )
-        print(f"   Western states: {western_states.size().getInfo()} features")
         
         # Filter by numeric property
         large_counties = datasets['counties'].filter(
             ee.Filter.gt('ALAND', 1e10)  # > 10,000 km²
         )
-        print(f"   Large counties: {large_counties.size().getInfo()} features")
-        
-        # Spatial filtering
-        print("\n2. Spatial Filtering:")
         
-        # Features intersecting California
-        ca_counties = datasets['counties'].filterBounds(california)
-        print(f"   Counties in California: {ca_counties.size().getInfo()} features")
+        # Spatial filtering: features intersecting California
+        ca_counties = datasets['counties'].filterBounds(ca_geom)
         
         # Point in polygon
         point = ee.Geometry.Point([-122.4, 37.8])  # San Francisco
         point_county = datasets['counties'].filterBounds(point)
-        county_name = point_county.first().get('NAME').getInfo()
+        
+        # Fetch every value printed below in one request
+        self._prefetch({
+            'size:california': california.size(),
+            'size:western_states': western_states.size(),
+            'size:large_counties': large_counties.size(),
+            'size:ca_counties': ca_counties.size(),
+            'sf_county_name': point_county.first().get('NAME')
+        })
+        
+        print("1. Attribute Filtering:")
+        print(f"   California feature: {self._size(california, 'california')} feature(s)")
+        print(f"   Western states: {self._size(western_states, 'western_states')} features")
+        print(f"   Large counties: {self._size(large_counties, 'large_counties')} features")
+        
+        print("\n2. Spatial Filtering:")
+        print(f"   Counties in California: {self._size(ca_counties, 'ca_counties')} features")
+        county_name = self._info(point_county.first().get('NAME'), 'sf_county_name')
         print(f"   County containing SF: {county_name}")
         
         return {
             'california': california,
+            'ca_geom': ca_geom,
             'western_states': western_states,
             'ca_counties': ca_counties
         }
     
-    def geometric_operations(self, features):
-        """Demonstrate geometric operations on features."""
+    def geometric_operations(self, features, sample_fraction=0.2, seed=42):
+        """
+        Demonstrate geometric operations on features.
+        
+        Args:
+            features: Output of basic_feature_operations
+            sample_fraction: Fraction of counties in the shared random sample
+            seed: Seed for the sample's random column
+        
+        Returns:
+            dict: Derived county collections, including the 'sample_counties'
+                subset reused by the later analysis steps
+        """
         print("\n📐 Geometric Operations")
         print("-" * 30)
         
-        california = features['california']
+        ca_geom = features['ca_geom']
         ca_counties = features['ca_counties']
         
         # Area calculations
@@ -129,8 +214,9 @@ class VectorOperations:
         
         # Get largest county
         largest_county = ca_counties_with_area.sort('area_km2', False).first()
-        largest_name = largest_county.get('NAME').getInfo()
-        largest_area = largest_county.get('area_km2').getInfo()
+        largest = self._info(largest_county.toDictionary(['NAME', 'area_km2']), 'largest_county')
+        largest_name = largest['NAME']
+        largest_area = largest['area_km2']
         print(f"   Largest CA county: {largest_name} ({largest_area:.0f} km²)")
         
         # Centroid calculation
@@ -138,7 +224,7 @@ class VectorOperations:
         
         def add_centroid(feature):
             """Add centroid coordinates to feature."""
-            centroid = feature.geometry().centroid()
+            centroid = feature.geometry().centroid(maxError=10)
             coords = centroid.coordinates()
             return feature.set({
                 'centroid_lon': coords.get(0),
@@ -151,8 +237,8 @@ class VectorOperations:
         print("3. Buffer Operations:")
         
         # Create buffer around California
-        ca_buffer_50km = california.geometry().buffer(50000)  # 50 km buffer
-        ca_buffer_100km = california.geometry().buffer(100000)  # 100 km buffer
+        ca_buffer_50km = ca_geom.buffer(50000, maxError=1000)  # 50 km buffer
+        ca_buffer_100km = ca_geom.buffer(100000, maxError=1000)  # 100 km buffer
         
         print("   ✓ Created 50km and 100km buffers around California")
         
@@ -164,40 +250,56 @@ class VectorOperations:
             simplified = feature.geometry().simplify(maxError=1000)  # 1km tolerance
             return feature.setGeometry(simplified)
         
-        simplified_counties = ca_counties.map(simplify_geometry)
+        simplified_counties = ca_counties_with_area.map(simplify_geometry)
         print("   ✓ Simplified county geometries (1km tolerance)")
         
+        # One seeded random sample shared by the later steps instead of
+        # separate limit(N) prefixes
+        sample_counties = (ca_counties_with_area
+                           .randomColumn('rng', seed)
+                           .filter(ee.Filter.lt('rng', sample_fraction)))
+        
         return {
             'counties_with_area': ca_counties_with_area,
+            'sample_counties': sample_counties,
             'counties_with_centroids': counties_with_centroids,
             'ca_buffer_50km': ca_buffer_50km,
             'simplified_counties': simplified_counties
         }
     
-    def spatial_relationships(self, datasets, processed_features):
+    def spatial_relationships(self, datasets, processed_features, ca_geom):
         """Demonstrate spatial relationship operations."""
         print("\n🌐 Spatial Relationships")
         print("-" * 30)
         
-        california = processed_features['counties_with_area'].first().geometry()
-        ca_counties = processed_features['counties_with_area']
+        # Simplified outlines (1 km) are precise enough for the union and the
+        # centroids below; the full geometries stay available for export
+        ca_counties = processed_features['simplified_counties']
         
         # Intersection operations
         print("1. Intersection Operations:")
         
         # Protected areas in California
-        ca_protected = datasets['protected_areas'].filterBounds(california)
-        print(f"   Protected areas in CA: {ca_protected.size().getInfo()} areas")
+        ca_protected = datasets['protected_areas'].filterBounds(ca_geom)
         
         # Ecoregions intersecting California
-        ca_ecoregions = datasets['ecoregions'].filterBounds(california)
-        print(f"   Ecoregions in CA: {ca_ecoregions.size().getInfo()} regions")
+        ca_ecoregions = datasets['ecoregions'].filterBounds(ca_geom)
+        
+        self._prefetch({
+            'size:ca_protected': ca_protected.size(),
+            'size:ca_ecoregions': ca_ecoregions.size()
+        })
+        print(f"   Protected areas in CA: {self._size(ca_protected, 'ca_protected')} areas")
+        print(f"   Ecoregions in CA: {self._size(ca_ecoregions, 'ca_ecoregions')} regions")
         
         # Union operations
         print("\n2. Union Operations:")
         
-        # Create union of all California counties
-        ca_union = ca_counties.geometry().dissolve()
+        # Create union of all California counties from the simplified
+        # outlines, built once per instance and reused
+        if self._ca_union is None:
+            self._ca_union = ca_counties.union(maxError=500).geometry()
+        ca_union = self._ca_union
         print("   ✓ Created union of all CA counties")
         
         # Difference operations
@@ -208,20 +310,27 @@ class VectorOperations:
             """Calculate unprotected area within county."""
             county_geom = county.geometry()
             
-            # Get protected areas in this county
-            county_protected = ca_protected.filterBounds(county_geom)
+            # Protected areas in this county, attached by the spatial join below
+            county_protected = ee.FeatureCollection(ee.List(county.get('protected')))
             
-            if county_protected.size().gt(0):
-                protected_union = county_protected.geometry().dissolve()
-                unprotected = county_geom.difference(protected_union)
-                unprotected_area = unprotected.area().divide(1e6)  # km²
-            else:
-                unprotected_area = county_geom.area().divide(1e6)
+            # An empty union leaves the county unchanged, so no branch is needed
+            protected_union = county_protected.geometry().dissolve(maxError=30)
+            unprotected = county_geom.difference(protected_union, maxError=30)
+            unprotected_area = unprotected.area().divide(1e6)  # km²
             
             return county.set('unprotected_area_km2', unprotected_area)
         
         # Apply to a subset for demonstration
-        sample_counties = ca_counties.limit(5)
+        sample_counties = processed_features['sample_counties']
+        
+        # Join each county to its intersecting protected areas in one pass;
+        # outer=True keeps counties without any protected area
+        protected_join = ee.Join.saveAll(matchesKey='protected', outer=True)
+        sample_counties = protected_join.apply(
+            primary=sample_counties,
+            secondary=ca_protected,
+            condition=ee.Filter.intersects(leftField='.geo', rightField='.geo', maxError=10)
+        )
         counties_with_unprotected = sample_counties.map(calculate_unprotected_area)
         
         print("   ✓ Calculated unprotected areas for sample counties")
@@ -232,20 +341,25 @@ class VectorOperations:
         # Create point features from county centroids
         def create_centroid_feature(county):
             """Create point feature from county centroid."""
-            centroid = county.geometry().centroid()
+            centroid = county.geometry().centroid(maxError=10)
             return ee.Feature(centroid, county.toDictionary())
         
         county_centroids = ca_counties.map(create_centroid_feature)
         
         # Distance to coast (using a coastal point)
         coast_point = ee.Geometry.Point([-122.5, 37.5])  # Pacific coast
-        
-        def add_distance_to_coast(feature):
-            """Add distance to coast."""
-            distance = feature.geometry().distance(coast_point)
-            return feature.set('distance_to_coast_m', distance)
-        
-        centroids_with_distance = county_centroids.map(add_distance_to_coast)
+        coast = ee.FeatureCollection([ee.Feature(coast_point)])
+        
+        # Join each centroid to the coast; saveBest stores the distance of the
+        # best match under measureKey (the 10,000 km limit matches every county)
+        distance_join = ee.Join.saveBest(matchKey='coast', measureKey='distance_to_coast_m')
+        centroids_with_distance = distance_join.apply(
+            primary=county_centroids,
+            secondary=coast,
+            condition=ee.Filter.withinDistance(
+                distance=1e7, leftField='.geo', rightField='.geo', maxError=100
+            )
+        )
         
         print("   ✓ Calculated distances to coast for county centroids")
         
@@ -257,7 +371,7 @@ class VectorOperations:
             'centroids_with_distance': centroids_with_distance
         }
     
-    def zonal_statistics(self, vector_features):
+    def zonal_statistics(self, vector_features, ca_geom):
         """Demonstrate zonal statistics using raster data."""
         print("\n📊 Zonal Statistics")
         print("-" * 25)
@@ -270,121 +384,94 @@ class VectorOperations:
         print("   ✓ SRTM elevation data")
         print("   ✓ Population density data")
         
-        # Get California counties for analysis
-        ca_counties = vector_features['counties_with_area']
-        
-        # Calculate zonal statistics for elevation
-        print("\n1. Elevation Statistics:")
-        
-        def calculate_elevation_stats(feature):
-            """Calculate elevation statistics for a feature."""
-            stats = elevation.reduceRegion(
-                reducer=ee.Reducer.minMax().combine(
-                    reducer2=ee.Reducer.mean(),
-                    sharedInputs=True
-                ).combine(
-                    reducer2=ee.Reducer.stdDev(),
-                    sharedInputs=True
-                ),
-                geometry=feature.geometry(),
-                scale=90,  # SRTM resolution
-                maxPixels=1e9
-            )
-            
-            return feature.set({
-                'elevation_min': stats.get('elevation_min'),
-                'elevation_max': stats.get('elevation_max'),
-                'elevation_mean': stats.get('elevation_mean'),
-                'elevation_stdDev': stats.get('elevation_stdDev')
-            })
-        
-        # Apply to sample counties
-        sample_counties = ca_counties.limit(10)
-        counties_with_elevation = sample_counties.map(calculate_elevation_stats)
-        
-        print("   ✓ Calculated elevation statistics for sample counties")
-        
-        # Calculate population statistics
-        print("\n2. Population Statistics:")
-        
-        def calculate_population_stats(feature):
-            """Calculate population statistics for a feature."""
-            # Population density (people per km²)
-            pop_stats = population.select('population_density').reduceRegion(
-                reducer=ee.Reducer.mean().combine(
-                    reducer2=ee.Reducer.sum(),
-                    sharedInputs=True
-                ),
-                geometry=feature.geometry(),
-                scale=1000,
-                maxPixels=1e9
+        def simplify_for_scale(collection, scale):
+            """Simplify geometries to half the reducer scale before reducing."""
+            return collection.map(
+                lambda feature: feature.setGeometry(feature.geometry().simplify(maxError=scale / 2))
             )
-            
-            area_km2 = feature.geometry().area().divide(1e6)
-            total_population = pop_stats.get('population_density_sum')
-            
-            return feature.set({
-                'pop_density_mean': pop_stats.get('population_density_mean'),
-                'total_population_est': total_population,
-                'area_km2': area_km2
-            })
-        
-        counties_with_population = sample_counties.map(calculate_population_stats)
-        
-        print("   ✓ Calculated population statistics for sample counties")
-        
-        # Vegetation statistics using NDVI
-        print("\n3. Vegetation Statistics (NDVI):")
         
         # Get recent Landsat image
         landsat = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
                   .filterDate('2023-06-01', '2023-09-01')
-                  .filterBounds(ca_counties.geometry())
+                  .filterBounds(ca_geom)
                   .sort('CLOUD_COVER')
                   .first())
         
         # Calculate NDVI
         ndvi = landsat.normalizedDifference(['SR_B5', 'SR_B4']).rename('NDVI')
         
-        def calculate_ndvi_stats(feature):
-            """Calculate NDVI statistics for a feature."""
-            ndvi_stats = ndvi.reduceRegion(
-                reducer=ee.Reducer.mean().combine(
-                    reducer2=ee.Reducer.stdDev(),
-                    sharedInputs=True
-                ).combine(
-                    reducer2=ee.Reducer.percentile([25, 75]),
-                    sharedInputs=True
-                ),
-                geometry=feature.geometry(),
-                scale=30,
-                maxPixels=1e9
-            )
-            
-            return feature.set({
-                'ndvi_mean': ndvi_stats.get('NDVI_mean'),
-                'ndvi_stdDev': ndvi_stats.get('NDVI_stdDev'),
-                'ndvi_p25': ndvi_stats.get('NDVI_p25'),
-                'ndvi_p75': ndvi_stats.get('NDVI_p75')
-            })
+        # Stack elevation, population density, NDVI and pixel area so each
+        # county is rasterized and its pixels walked once for all layers
+        print("\n1. Combined Raster Stack:")
+        stack = (elevation.rename('elevation')
+                 .addBands(population.select('population_density').rename('pop_density'))
+                 .addBands(ndvi.rename('ndvi'))
+                 .addBands(ee.Image.pixelArea().divide(1e6).rename('pixel_area_km2')))
+        print("   ✓ Stacked elevation, population density, NDVI and pixel area")
+        
+        # One combined reducer; outputs are named <band>_<statistic>
+        reducer = _zonal_reducer()
+        
+        # Apply to sample counties at the SRTM resolution
+        print("\n2. Zonal Statistics (elevation, population, NDVI):")
+        scale = 90
+        # Get the shared sample of California counties for analysis
+        sample_counties = simplify_for_scale(vector_features['sample_counties'], scale)
+        county_stats = stack.reduceRegions(
+            collection=sample_counties,
+            reducer=reducer,
+            scale=scale
+        )
+        
+        def add_population_estimate(feature):
+            """Estimate total population from mean density and reduced pixel area."""
+            density = ee.Number(feature.get('pop_density_mean'))
+            return feature.set('total_population_est', density.multiply(feature.get('pixel_area_km2_sum')))
         
-        counties_with_ndvi = sample_counties.map(calculate_ndvi_stats)
+        county_stats = county_stats.map(add_population_estimate)
         
-        print("   ✓ Calculated NDVI statistics for sample counties")
+        print("   ✓ Calculated elevation, population and NDVI statistics for sample counties")
         
         return {
-            'elevation_stats': counties_with_elevation,
-            'population_stats': counties_with_population,
-            'ndvi_stats': counties_with_ndvi
+            'elevation_stats': county_stats,
+            'population_stats': county_stats,
+            'ndvi_stats': county_stats
         }
     
+    @staticmethod
+    def _create_grid(bounds, cell_size):
+        """Create a regular grid over the bounds by polygonizing a cell ID image."""
+        # Lon/lat projection whose pixels are exactly one grid cell
+        grid_proj = ee.Projection('EPSG:4326').scale(cell_size, cell_size)
+        
+        # Unique integer ID per cell, so neighbouring cells never merge
+        cell_ids = (ee.Image.pixelCoordinates(grid_proj)
+                    .expression('floor(b(0)) * 1e6 + floor(b(1))')
+                    .toInt64()
+                    .rename('cell_id'))
+        
+        grid = cell_ids.reduceToVectors(
+            geometry=bounds,
+            crs=grid_proj,
+            geometryType='polygon',
+            eightConnected=False,
+            labelProperty='cell_id',
+            maxPixels=1e10
+        )
+        
+        def add_cell_origin(cell):
+            """Record the lower-left corner of the cell."""
+            corner = ee.List(ee.List(cell.geometry().bounds().coordinates().get(0)).get(0))
+            return cell.set({'grid_x': corner.get(0), 'grid_y': corner.get(1)})
+        
+        return grid.map(add_cell_origin)
+    
     def create_custom_geometries(self):
         """Demonstrate creating custom geometries and features."""
         print("\n🎨 Custom Geometry Creation")
         print("-" * 35)
         
-        # Create points
-        print("1. Creating Points:")
+        # Points
         points = [
             ee.Geometry.Point([-122.4, 37.8]),  # San Francisco
             ee.Geometry.Point([-118.2, 34.1]),  # Los Angeles
@@ -397,11 +484,6 @@ class VectorOperations:
             ee.Feature(points[2], {'city': 'Sacramento', 'population': 525000})
         ])
         
-        print(f"   ✓ Created {point_features.size().getInfo()} city points")
-        
-        # Create lines
-        print("\n2. Creating Lines:")
-        
         # Highway route (simplified)
         highway_coords = [
             [-122.4, 37.8],  # San Francisco
@@ -409,17 +491,7 @@ class VectorOperations:
             [-120.7, 36.7],  # Fresno
             [-118.2, 34.1]   # Los Angeles
         ]
-        
         highway = ee.Geometry.LineString(highway_coords)
-        highway_feature = ee.Feature(highway, {
-            'name': 'California Highway Route',
-            'length_km': highway.length().divide(1000)
-        })
-        
-        print("   ✓ Created highway route line")
-        
-        # Create polygons
-        print("\n3. Creating Polygons:")
         
         # Study area polygon
         study_area_coords = [[
@@ -429,11 +501,38 @@ class VectorOperations:
             [-123.0, 38.0],
             [-123.0, 37.0]
         ]]
-        
         study_area = ee.Geometry.Polygon(study_area_coords)
+        
+        # 0.1 degree grid over study area
+        grid = self._create_grid(study_area, 0.1)
+        
+        # Fetch the derived scalars in one request so they can be stored as
+        # plain values instead of server-side expressions
+        self._prefetch({
+            'size:cities': point_features.size(),
+            'highway_length_km': highway.length().divide(1000),
+            'study_area_km2': study_area.area().divide(1e6),
+            'size:grid': grid.size()
+        })
+        
+        # Create points
+        print("1. Creating Points:")
+        print(f"   ✓ Created {self._size(point_features, 'cities')} city points")
+        
+        # Create lines
+        print("\n2. Creating Lines:")
+        highway_feature = ee.Feature(highway, {
+            'name': 'California Highway Route',
+            'length_km': self._info(highway.length().divide(1000), 'highway_length_km')
+        })
+        
+        print("   ✓ Created highway route line")
+        
+        # Create polygons
+        print("\n3. Creating Polygons:")
         study_area_feature = ee.Feature(study_area, {
             'name': 'San Francisco Bay Study Area',
-            'area_km2': study_area.area().divide(1e6)
+            'area_km2': self._info(study_area.area().divide(1e6), 'study_area_km2')
         })
         
         print("   ✓ Created study area polygon")
@@ -446,7 +545,7 @@ class VectorOperations:
             population = ee.Number(feature.get('population'))
             # Buffer radius based on population (scaled)
             radius = population.sqrt().multiply(10)
-            buffered_geom = feature.geometry().buffer(radius)
+            buffered_geom = feature.geometry().buffer(radius, maxError=100)
             return feature.setGeometry(buffered_geom).set('buffer_radius', radius)
         
         city_buffers = point_features.map(create_city_buffer)
@@ -455,49 +554,7 @@ class VectorOperations:
         
         # Create regular grid
         print("\n5. Creating Regular Grid:")
-        
-        def create_grid(bounds, cell_size):
-            """Create a regular grid over the bounds."""
-            # Get bounding box
-            coords = ee.List(bounds.coordinates().get(0))
-            
-            # Extract min/max coordinates
-            xs = coords.map(lambda item: ee.List(item).get(0))
-            ys = coords.map(lambda item: ee.List(item).get(1))
-            
-            min_x = xs.reduce(ee.Reducer.min())
-            max_x = xs.reduce(ee.Reducer.max())
-            min_y = ys.reduce(ee.Reducer.min())
-            max_y = ys.reduce(ee.Reducer.max())
-            
-            # Create grid
-            x_range = ee.List.sequence(min_x, max_x, cell_size)
-            y_range = ee.List.sequence(min_y, max_y, cell_size)
-            
-            def create_cell(x):
-                def create_row(y):
-                    x_coord = ee.Number(x)
-                    y_coord = ee.Number(y)
-                    
-                    cell = ee.Geometry.Rectangle([
-                        x_coord, y_coord,
-                        x_coord.add(cell_size), y_coord.add(cell_size)
-                    ])
-                    
-                    return ee.Feature(cell, {
-                        'grid_x': x_coord,
-                        'grid_y': y_coord,
-                        'cell_id': x_coord.format('%.2f').cat('_').cat(y_coord.format('%.2f'))
-                    })
-                
-                return y_range.map(create_row)
-            
-            grid_features = x_range.map(create_cell).flatten()
-            return ee.FeatureCollection(grid_features)
-        
-        # Create 0.1 degree grid over study area
-        grid = create_grid(study_area, 0.1)
-        grid_count = grid.size().getInfo()
+        grid_count = self._size(grid, 'grid')
         print(f"   ✓ Created regular grid with {grid_count} cells")
         
         return {
@@ -508,8 +565,20 @@ class VectorOperations:
             'grid': grid
         }
     
-    def export_vector_data(self, feature_collection, description):
-        """Demonstrate vector data export."""
+    def export_vector_data(self, feature_collection, description, file_format='SHP', selectors=None):
+        """
+        Demonstrate vector data export.
+        
+        Args:
+            feature_collection: ee.FeatureCollection to export
+            description: Task description and file name
+            file_format: 'SHP' to keep geometries, or 'CSV' for attribute tables
+            selectors: Properties to export; for CSV, leaving out '.geo' skips
+                geometry serialization entirely
+        
+        Returns:
+            ee.batch.Task: The (unstarted) export task
+        """
         print(f"\n📤 Exporting Vector Data: {description}")
         print("-" * 40)
         
@@ -518,13 +587,14 @@ class VectorOperations:
             collection=feature_collection,
             description=description,
             folder='EarthEngine_Exports',
-            fileFormat='SHP'  # Shapefile format
+            fileFormat=file_format,
+            selectors=selectors
         )
         
         print(f"✓ Export task created: {description}")
         print(f"  Task ID: {export_task.id}")
         print(f"  Status: Ready to start")
-        print(f"  Format: Shapefile")
+        print(f"  Format: {'Shapefile' if file_format == 'SHP' else file_format}")
         print(f"  Destination: Google Drive/EarthEngine_Exports/")
         
         # Note: To actually start the export, uncomment the line below
@@ -552,10 +622,11 @@ def main():
     geometric_results = vector_ops.geometric_operations(basic_features)
     
     # Step 4: Spatial relationships
-    spatial_results = vector_ops.spatial_relationships(datasets, geometric_results)
+    ca_geom = basic_features['ca_geom']
+    spatial_results = vector_ops.spatial_relationships(datasets, geometric_results, ca_geom)
     
     # Step 5: Zonal statistics
-    zonal_results = vector_ops.zonal_statistics(geometric_results)
+    zonal_results = vector_ops.zonal_statistics(geometric_results, ca_geom)
     
     # Step 6: Create custom geometries
     custom_geometries = vector_ops.create_custom_geometries()
@@ -564,10 +635,12 @@ def main():
     print("\n📤 Export Examples")
     print("-" * 25)
     
-    # Export California counties with statistics
+    # Export California counties with statistics as a table (no geometries)
     counties_export = vector_ops.export_vector_data(
-        geometric_results['counties_with_area'].limit(5),
-        'california_counties_with_area'
+        geometric_results['sample_counties'],
+        'california_counties_with_area',
+        file_format='CSV',
+        selectors=['NAME', 'GEOID', 'area_km2']
     )
     
     # Export custom city features
@@ -591,9 +664,17 @@ def main():
     print("• Vector data export")
     
     print("\n📈 Key Results:")
-    print(f"• California counties analyzed: {basic_features['ca_counties'].size().getInfo()}")
-    print(f"• Protected areas in CA: {spatial_results['ca_protected'].size().getInfo()}")
-    print(f"• Custom grid cells created: {custom_geometries['grid'].size().getInfo()}")
+    # Sizes were already fetched by the steps above and are served from the cache
+    print(f"• California counties analyzed: {vector_ops._size(basic_features['ca_counties'], 'ca_counties')}")
+    print(f"• Protected areas in CA: {vector_ops._size(spatial_results['ca_protected'], 'ca_protected')}")
+    print(f"• Custom grid cells created: {vector_ops._size(custom_geometries['grid'], 'grid')}")
+    
+    # Zonal statistics table for the sampled counties (attributes only)
+    zonal_df = to_df(zonal_results['elevation_stats'], [
+        'NAME', 'elevation_mean', 'pop_density_mean', 'total_population_est', 'ndvi_mean'
+    ])
+    print("\n📋 Sample County Statistics:")
+    print(zonal_df.round(2).to_string(index=False))
     
     print("\n🏆 Best Practices Applied:")
     print("• Efficient spatial filtering")